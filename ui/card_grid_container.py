@@ -4,11 +4,14 @@
 支持纯垂直滚动，自动分配左右边距
 """
 from PyQt5.QtWidgets import QWidget, QScrollArea
-from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtCore import Qt, pyqtSignal, QTimer
 from PyQt5.QtGui import QPainter, QColor
 from ui.tool_card_v3 import ToolCardV3 as ToolCardV2  # 使用V3但保持兼容性
 from utils.fuzzy_search import fuzzy_search_tools
 
+# 滚动/缩放停止多久后恢复卡片阴影（毫秒）
+_EFFECT_RESTORE_DELAY_MS = 120
+
 
 class CardGridContainer(QWidget):
     """
@@ -44,19 +47,25 @@ class CardGridContainer(QWidget):
     
     def add_card(self, tool_data: dict):
         """添加新卡片"""
+        card = self._create_card(tool_data)
+        self._relayout_cards()
+        card.show()
+    
+    def _create_card(self, tool_data: dict) -> ToolCardV2:
+        """创建卡片并连接信号（不重新布局，也不显示）"""
         card = ToolCardV2(tool_data, self)
         
-        # 连接卡片信号
-        card.clicked.connect(self._on_card_clicked)
-        card.install_clicked.connect(self.card_install_clicked.emit)
-        card.launch_clicked.connect(self.card_launch_clicked.emit)
+        # 连接卡片信号（卡片和容器都在GUI线程，直接连接；
+        # 转发类信号直接连到容器信号上，不经过Python槽函数）
+        card.clicked.connect(self._on_card_clicked, Qt.DirectConnection)
+        card.install_clicked.connect(self.card_install_clicked, Qt.DirectConnection)
+        card.launch_clicked.connect(self.card_launch_clicked, Qt.DirectConnection)
         # 连接新的收藏信号
         if hasattr(card, 'favorite_toggled'):
-            card.favorite_toggled.connect(self.card_favorite_toggled.emit)
+            card.favorite_toggled.connect(self.card_favorite_toggled, Qt.DirectConnection)
         
         self.cards.append(card)
-        self._relayout_cards()
-        card.show()
+        return card
     
     def remove_card(self, tool_name: str):
         """移除指定卡片"""
@@ -68,18 +77,32 @@ class CardGridContainer(QWidget):
         
         self._relayout_cards()
     
-    def clear_cards(self):
-        """清空所有卡片"""
+    def clear_cards(self, relayout: bool = True):
+        """清空所有卡片（relayout为False时由调用方在之后统一布局）"""
         for card in self.cards:
             card.deleteLater()
         self.cards.clear()
-        self._relayout_cards()
+        if relayout:
+            self._relayout_cards()
     
     def set_cards(self, tools_data: list):
-        """设置卡片列表"""
-        self.clear_cards()
-        for tool_data in tools_data:
-            self.add_card(tool_data)
+        """
+        设置卡片列表
+        批量创建期间关闭容器更新，所有卡片创建完成后只布局和重绘一次
+        """
+        self.setUpdatesEnabled(False)
+        try:
+            self.clear_cards(relayout=False)
+            
+            for tool_data in tools_data:
+                self._create_card(tool_data)
+            
+            self._relayout_cards()
+            for card in self.cards:
+                card.show()
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
     
     def _calculate_grid_layout(self, container_width: int) -> tuple:
         """
@@ -247,6 +270,11 @@ class CardGridContainer(QWidget):
                 continue
         return None
     
+    def set_card_effects_enabled(self, enabled: bool):
+        """启用/暂停所有卡片的阴影效果"""
+        for card in self.cards:
+            card.set_effect_enabled(enabled)
+    
     def paintEvent(self, event):
         """自定义绘制背景 - 简化绘制避免重叠"""
         painter = QPainter(self)
@@ -274,12 +302,12 @@ class CardScrollArea(QScrollArea):
         # 创建网格容器
         self.grid_container = CardGridContainer()
         
-        # 连接信号
-        self.grid_container.card_selected.connect(self.card_selected.emit)
-        self.grid_container.card_install_clicked.connect(self.card_install_clicked.emit)
-        self.grid_container.card_launch_clicked.connect(self.card_launch_clicked.emit)
-        self.grid_container.card_info_clicked.connect(self.card_info_clicked.emit)
-        self.grid_container.card_favorite_toggled.connect(self.card_favorite_toggled.emit)  # 新增：收藏信号
+        # 连接信号（同一线程内的信号转发，直接连接）
+        self.grid_container.card_selected.connect(self.card_selected, Qt.DirectConnection)
+        self.grid_container.card_install_clicked.connect(self.card_install_clicked, Qt.DirectConnection)
+        self.grid_container.card_launch_clicked.connect(self.card_launch_clicked, Qt.DirectConnection)
+        self.grid_container.card_info_clicked.connect(self.card_info_clicked, Qt.DirectConnection)
+        self.grid_container.card_favorite_toggled.connect(self.card_favorite_toggled, Qt.DirectConnection)  # 新增：收藏信号
         
         # 设置滚动区域属性
         self.setWidget(self.grid_container)
@@ -298,6 +326,13 @@ class CardScrollArea(QScrollArea):
                 background-color: #f8fafc;
             }
         """)
+        
+        # 滚动/缩放期间暂停卡片阴影，停止后由计时器恢复
+        self._effects_suspended = False
+        self._effect_restore_timer = QTimer(self)
+        self._effect_restore_timer.setSingleShot(True)
+        self._effect_restore_timer.setInterval(_EFFECT_RESTORE_DELAY_MS)
+        self._effect_restore_timer.timeout.connect(self._restore_card_effects)
     
     def add_card(self, tool_data: dict):
         """添加新卡片"""
@@ -323,8 +358,27 @@ class CardScrollArea(QScrollArea):
         """根据工具名称获取卡片对象"""
         return self.grid_container.get_card_by_name(tool_name)
     
+    def _suspend_card_effects(self):
+        """暂停卡片阴影，并在交互停止后恢复"""
+        if not self._effects_suspended:
+            self._effects_suspended = True
+            self.grid_container.set_card_effects_enabled(False)
+        self._effect_restore_timer.start()
+    
+    def _restore_card_effects(self):
+        """交互停止后恢复卡片阴影"""
+        self._effects_suspended = False
+        self.grid_container.set_card_effects_enabled(True)
+    
+    def scrollContentsBy(self, dx, dy):
+        """滚动时暂停卡片阴影"""
+        self._suspend_card_effects()
+        super().scrollContentsBy(dx, dy)
+    
     def resizeEvent(self, event):
         """窗口尺寸变化时通知容器"""
+        if hasattr(self, '_effect_restore_timer'):
+            self._suspend_card_effects()
         super().resizeEvent(event)
         # 容器会自动通过父容器宽度计算布局
         if hasattr(self, 'grid_container'):
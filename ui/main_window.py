@@ -420,14 +420,15 @@ class MainWindow(QMainWindow):
         
         # 设置面板信号连接
         self.settings_panel.setting_changed.connect(self._on_setting_changed)
+        self.settings_panel.settings_bulk_changed.connect(self._on_settings_bulk_changed)
         
-        # 卡片滚动区域信号连接
-        self.tools_grid.card_selected.connect(self._on_card_selected)
-        self.tools_grid.card_install_clicked.connect(self._on_install_tool)
-        self.tools_grid.card_launch_clicked.connect(self._on_launch_tool)
+        # 卡片滚动区域信号连接（卡片只在GUI线程发出信号，直接连接）
+        self.tools_grid.card_selected.connect(self._on_card_selected, Qt.DirectConnection)
+        self.tools_grid.card_install_clicked.connect(self._on_install_tool, Qt.DirectConnection)
+        self.tools_grid.card_launch_clicked.connect(self._on_launch_tool, Qt.DirectConnection)
         # 连接收藏信号（如果卡片容器支持）
         if hasattr(self.tools_grid, 'card_favorite_toggled'):
-            self.tools_grid.card_favorite_toggled.connect(self._on_tool_favorite_toggled)
+            self.tools_grid.card_favorite_toggled.connect(self._on_tool_favorite_toggled, Qt.DirectConnection)
         # 移除了card_info_clicked，改为直接显示详情页面
     
     def load_styles(self):
@@ -1261,7 +1262,7 @@ class MainWindow(QMainWindow):
                 card.tool_data['status'] = 'installed'
                 card.tool_data['executable_path'] = f"/path/to/{tool_name.lower()}"
                 card.tool_data['disk_usage'] = "15.2 MB"
-                card.update(); card.repaint()
+                card.update()
                 msg = f"[日志-I6] 已更新ToolCardV3数据并重绘: {tool_name}"
             else:
                 msg = f"[日志-I6] 警告：未知的卡片类型，无法更新状态: {tool_name}"
@@ -1286,7 +1287,7 @@ class MainWindow(QMainWindow):
                         wcard.tool_data['status'] = 'installed'
                         wcard.tool_data['executable_path'] = f"/path/to/{tool_name.lower()}"
                         wcard.tool_data['disk_usage'] = "15.2 MB"
-                        wcard.update(); wcard.repaint()
+                        wcard.update()
         except Exception:
             pass
         
@@ -1416,7 +1417,7 @@ class MainWindow(QMainWindow):
                 card.tool_data['status'] = 'available'
                 card.tool_data['executable_path'] = ""
                 card.tool_data['disk_usage'] = ""
-                card.update(); card.repaint()
+                card.update()
                 print(f"[日志-D6] 已更新ToolCardV3数据并重绘为未安装状态: {tool_name}")
             else:
                 print(f"[日志-D6] 警告：未知的卡片类型，无法更新状态: {tool_name}")
@@ -1451,7 +1452,7 @@ class MainWindow(QMainWindow):
                         wcard.tool_data['status'] = 'available'
                         wcard.tool_data['executable_path'] = ""
                         wcard.tool_data['disk_usage'] = ""
-                        wcard.update(); wcard.repaint()
+                        wcard.update()
         except Exception:
             pass
         
@@ -1509,7 +1510,7 @@ class MainWindow(QMainWindow):
                 card.update_tool_status(new_status)
             elif hasattr(card, 'tool_data'):
                 card.tool_data['status'] = new_status
-                card.update(); card.repaint()
+                card.update()
         else:
             logger.info(f"[状态变更] 未找到卡片: {tool_name}，刷新整个工具网格")
 
@@ -1524,7 +1525,7 @@ class MainWindow(QMainWindow):
                         wcard.update_tool_status(new_status)
                     elif hasattr(wcard, 'tool_data'):
                         wcard.tool_data['status'] = new_status
-                        wcard.update(); wcard.repaint()
+                        wcard.update()
         except Exception:
             pass
 
@@ -1589,7 +1590,7 @@ class MainWindow(QMainWindow):
                     if wcard and hasattr(wcard, 'set_installing_state'):
                         is_installing_operation = not is_uninstall
                         wcard.set_installing_state(is_installing_operation, progress, status_text)
-                        wcard.update(); wcard.repaint()
+                        wcard.update()
             except Exception:
                 pass
 
@@ -1910,6 +1911,15 @@ class MainWindow(QMainWindow):
         
         print(f"设置已更新: {setting_name} = {value}")
     
+    def _on_settings_bulk_changed(self, changes: dict):
+        """批量设置变更处理（如重置为默认值），界面更新合并为一次"""
+        self.setUpdatesEnabled(False)
+        try:
+            for setting_name, value in changes.items():
+                self._on_setting_changed(setting_name, value)
+        finally:
+            self.setUpdatesEnabled(True)
+    
     def _select_tool_card(self, tool_name: str):
         """选中指定的工具卡片"""
         card = self.tools_grid.get_card_by_name(tool_name)
@@ -2209,7 +2219,6 @@ class MainWindow(QMainWindow):
                     # 直接设置属性并重绘（适配其他卡片类型）
                     card.is_favorite = actual_state
                     card.update()
-                    card.repaint()
                     print(f"[收藏操作-同步3] 直接设置 is_favorite 属性并重绘: {tool_name} -> {'收藏' if actual_state else '未收藏'}")
                 else:
                     print(f"[收藏操作-同步3] 警告：卡片不支持收藏更新: {type(card).__name__}")
@@ -12,7 +12,14 @@
 技术栈：ResponsiveDetailPageManager + ResponsiveSettingsCard
 确保在任何窗口尺寸下都能完美显示，杜绝内容截断问题。
 """
+# NOTE: UI构建模块，耗时集中在Qt控件创建与样式表解析，没有数值计算热点；
+# 不要引入Cython/Numba等JIT/编译依赖，优化应通过样式表复用、信号阻塞和延迟构建实现。
+import functools
+import json
 import logging
+import os
+from dataclasses import asdict, fields
+from pathlib import Path
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QPushButton, QScrollArea, QFrame,
@@ -20,10 +27,17 @@ from PyQt5.QtWidgets import (
     QListWidget, QListWidgetItem, QTextEdit, QSplitter, QSpinBox,
     QLineEdit, QSizePolicy
 )
-from PyQt5.QtCore import pyqtSignal, Qt
-from PyQt5.QtGui import QFont
+from PyQt5.QtCore import pyqtSignal, Qt, QEvent, QSignalBlocker, QRegularExpression
+from PyQt5.QtGui import QFont, QRegularExpressionValidator
 from data.config import ConfigManager, Settings
 
+# 可选依赖：orjson用于设置导入导出的快速序列化
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # 获取logger
 logger = logging.getLogger('BioNexus.SettingsPanel')
 from .responsive_layout import (
@@ -34,6 +48,74 @@ from .responsive_layout import (
     IOSToggleSwitch,
     validate_responsive_config
 )
+from .storage_manager_widget import StorageManagerWidget
+
+# 开关控件objectName前缀，用于在_dispatch_toggle中还原设置名称
+_TOGGLE_PREFIX = "toggle::"
+
+# 路径输入框允许的字符（拒绝NUL及Windows非法字符），由QRegularExpressionValidator在C++侧校验
+_PATH_SYNTAX_RE = QRegularExpression(r'^[^\0<>|?*"]*$')
+
+# 路径输入框样式，[invalid="true"]为路径不存在时的错误态
+_QSS_PATH_INPUT = """
+    QLineEdit {
+        padding: 10px 12px;
+        border: 1px solid #d1d5db;
+        border-radius: 6px;
+        background-color: #ffffff;
+        color: #374151;
+        font-size: 12px;
+        font-family: 'Consolas', 'Monaco', monospace;
+        min-height: 18px;
+        selection-background-color: #3b82f6;
+    }
+    QLineEdit:focus {
+        border-color: #3b82f6;
+        box-shadow: 0 0 0 3px rgba(59, 130, 246, 0.1);
+    }
+    QLineEdit:hover {
+        border-color: #9ca3af;
+    }
+    QLineEdit[invalid="true"] {
+        border: 1px solid #ef4444;
+        background-color: #fef2f2;
+        color: #dc2626;
+        selection-background-color: #ef4444;
+    }
+    QLineEdit[invalid="true"]:hover,
+    QLineEdit[invalid="true"]:focus {
+        border-color: #dc2626;
+        box-shadow: 0 0 0 3px rgba(239, 68, 68, 0.1);
+    }
+"""
+
+# 重置为默认值时需要通知的设置项
+_RESET_KEYS = (
+    "auto_update", "check_tool_status_on_startup",
+    "show_detailed_install_log", "use_mirror_source",
+    "keep_install_cache"
+)
+
+# Settings中定义的字段名，导入设置时用于过滤未知键
+_SETTINGS_FIELDS = frozenset(f.name for f in fields(Settings))
+
+# 工具更新检查频率：天数 -> 下拉框索引
+_FREQUENCY_DAYS_TO_INDEX = {1: 0, 3: 1, 7: 2, 14: 3}
+# 反向映射：下拉框索引 -> 天数
+_FREQUENCY_INDEX_TO_DAYS = {index: days for days, index in _FREQUENCY_DAYS_TO_INDEX.items()}
+
+# 语言下拉框中的语言代码（顺序与下拉项一致）及反向映射：语言代码 -> 索引
+_LANGUAGE_CODES = ("zh_CN", "en_US", "de_DE")
+_LANGUAGE_INDEX = {code: index for index, code in enumerate(_LANGUAGE_CODES)}
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_exists(path: str) -> bool:
+    """
+    缓存路径存在性检查结果
+    避免输入框每次按键都触发stat()系统调用；打开浏览对话框前会清空缓存
+    """
+    return os.path.exists(path)
 
 
 class NoWheelComboBox(QComboBox):
@@ -53,6 +135,58 @@ class NoWheelComboBox(QComboBox):
             event.ignore()
 
 
+# 设置面板下拉框/数字框共用样式（同一字符串对象，便于Qt样式表缓存命中）
+_QSS_COMBO = """
+    QComboBox {
+        padding: 8px 12px;
+        border: 1px solid #d1d5db;
+        border-radius: 8px;
+        background-color: white;
+        min-width: 120px;
+    }
+    QComboBox:hover {
+        border-color: #3b82f6;
+    }
+    QComboBox::drop-down {
+        subcontrol-origin: padding;
+        subcontrol-position: top right;
+        width: 20px;
+        border-left: none;
+    }
+"""
+
+_QSS_SPINBOX = """
+    QSpinBox {
+        padding: 8px 12px;
+        border: 1px solid #d1d5db;
+        border-radius: 8px;
+        background-color: white;
+        min-width: 80px;
+    }
+    QSpinBox:hover {
+        border-color: #3b82f6;
+    }
+"""
+
+
+def _make_styled_combo(items=(), qss: str = _QSS_COMBO) -> NoWheelComboBox:
+    """创建带统一样式的下拉框（禁用滚轮意外切换）"""
+    combo = NoWheelComboBox()
+    combo.addItems(items)
+    combo.setStyleSheet(qss)
+    return combo
+
+
+def _make_styled_spinbox(minimum: int, maximum: int, suffix: str = "",
+                         qss: str = _QSS_SPINBOX) -> QSpinBox:
+    """创建带统一样式的数字输入框"""
+    spinbox = QSpinBox()
+    spinbox.setRange(minimum, maximum)
+    spinbox.setSuffix(suffix)
+    spinbox.setStyleSheet(qss)
+    return spinbox
+
+
 class ToggleSwitch(QPushButton):
     """
     自定义开关控件
@@ -185,11 +319,15 @@ class SettingsPanel(QWidget):
     # 信号定义 - 设置变更通知
     setting_changed = pyqtSignal(str, object)  # 设置名称, 新值
     directory_select_requested = pyqtSignal(str)  # 目录选择请求, 设置名称
+    settings_bulk_changed = pyqtSignal(dict)  # 批量设置变更 {设置名称: 新值}
     
     def __init__(self, config_manager: ConfigManager, parent=None):
         super().__init__(parent)
         self.config_manager = config_manager
         self.setting_switches = {}  # 存储开关控件的引用
+        self.path_inputs = {}  # 存储路径输入框的引用
+        self._lazy_cards = {}  # 延迟构建的卡片 -> 构建函数（首次显示时调用）
+        self.storage_manager = None
 
         # 翻译相关的UI元素引用(用于retranslateUi)
         self.ui_elements = {}
@@ -234,28 +372,34 @@ class SettingsPanel(QWidget):
         main_layout.addWidget(scroll_area)
         
         # 🎨 创建现代化卡片式设置分组
-        self._create_responsive_general_settings(content_container)
-        self._add_separator(content_container)
+        # 批量构建期间暂停重绘，避免每添加一个控件就触发一次布局和绘制
+        content_container.setUpdatesEnabled(False)
+        try:
+            self._create_responsive_general_settings(content_container)
+            self._add_separator(content_container)
 
-        self._create_responsive_language_settings(content_container)
-        self._add_separator(content_container)
+            self._create_responsive_language_settings(content_container)
+            self._add_separator(content_container)
 
-        self._create_responsive_environment_settings(content_container)
-        self._add_separator(content_container)
+            self._create_responsive_environment_settings(content_container)
+            self._add_separator(content_container)
 
-        self._create_responsive_advanced_settings(content_container)
-        self._add_separator(content_container)
+            self._create_responsive_advanced_settings(content_container)
+            self._add_separator(content_container)
 
-        self._create_responsive_storage_settings(content_container)
-        self._add_separator(content_container)
+            self._create_responsive_storage_settings(content_container)
+            self._add_separator(content_container)
 
-        self._create_responsive_storage_manager(content_container)  # 新增存储管理
-        self._add_separator(content_container)
+            self._create_responsive_storage_manager(content_container)  # 新增存储管理
+            self._add_separator(content_container)
 
-        self._create_responsive_tool_update_settings(content_container)
+            self._create_responsive_tool_update_settings(content_container)
 
-        # 添加弹性空间
-        content_container.layout.addStretch()
+            # 添加弹性空间
+            content_container.layout.addStretch()
+        finally:
+            content_container.setUpdatesEnabled(True)
+            content_container.update()
 
     def _add_separator(self, content_container: QWidget):
         """添加分隔线（左右留白）"""
@@ -332,29 +476,11 @@ class SettingsPanel(QWidget):
         content_container.add_section(language_card)
 
         # 界面语言选择器（禁用滚轮意外切换）
-        language_combo = NoWheelComboBox()
-        language_combo.addItem(self.tr("Simplified Chinese"), "zh_CN")
-        language_combo.addItem("English", "en_US")
-        language_combo.addItem("Deutsch", "de_DE")
+        language_combo = _make_styled_combo()
+        language_names = (self.tr("Simplified Chinese"), "English", "Deutsch")
+        for language_name, language_code in zip(language_names, _LANGUAGE_CODES):
+            language_combo.addItem(language_name, language_code)
         language_combo.setObjectName("LanguageComboBox")
-        language_combo.setStyleSheet("""
-            QComboBox {
-                padding: 8px 12px;
-                border: 1px solid #d1d5db;
-                border-radius: 8px;
-                background-color: white;
-                min-width: 120px;
-            }
-            QComboBox:hover {
-                border-color: #3b82f6;
-            }
-            QComboBox::drop-down {
-                subcontrol-origin: padding;
-                subcontrol-position: top right;
-                width: 20px;
-                border-left: none;
-            }
-        """)
         
         language_item = ResponsiveSettingsItem(
             self.tr("Interface Language"),
@@ -415,26 +541,11 @@ class SettingsPanel(QWidget):
         path_input.setMinimumWidth(300)  # 最小宽度
         path_input.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         
-        path_input.setStyleSheet("""
-            QLineEdit {
-                padding: 10px 12px;
-                border: 1px solid #d1d5db;
-                border-radius: 6px;
-                background-color: #ffffff;
-                color: #374151;
-                font-size: 12px;
-                font-family: 'Consolas', 'Monaco', monospace;
-                min-height: 18px;
-                selection-background-color: #3b82f6;
-            }
-            QLineEdit:focus {
-                border-color: #3b82f6;
-                box-shadow: 0 0 0 3px rgba(59, 130, 246, 0.1);
-            }
-            QLineEdit:hover {
-                border-color: #9ca3af;
-            }
-        """)
+        # 样式表含[invalid="true"]错误态，切换属性即可改变样式，无需重设样式表
+        path_input.setStyleSheet(_QSS_PATH_INPUT)
+        path_input.setProperty("invalid", False)
+        # 输入阶段仅做语法校验（在Qt内部完成），磁盘存在性在编辑完成后检查
+        path_input.setValidator(QRegularExpressionValidator(_PATH_SYNTAX_RE, path_input))
         
         # 设置当前路径值
         current_path = self._get_current_path_value(setting_name)
@@ -488,7 +599,8 @@ class SettingsPanel(QWidget):
         """)
 
         # 连接信号
-        path_input.textChanged.connect(lambda text: self._on_path_changed(setting_name, text))
+        path_input.textChanged.connect(lambda text: self._set_path_input_invalid(path_input, False))
+        path_input.editingFinished.connect(lambda: self._on_path_editing_finished(setting_name, path_input))
         browse_btn.clicked.connect(lambda: self._browse_directory(setting_name, path_input))
         reset_btn.clicked.connect(lambda: self._reset_to_default_path(setting_name, path_input))
 
@@ -498,16 +610,12 @@ class SettingsPanel(QWidget):
         layout.addWidget(reset_btn, 0)   # 还原按钮固定宽度
         
         # 保存引用以便后续操作
-        if not hasattr(self, 'path_inputs'):
-            self.path_inputs = {}
         self.path_inputs[setting_name] = path_input
         
         return container
     
     def _get_current_path_value(self, setting_name: str) -> str:
         """获取当前路径设置值（显示实际使用的路径）"""
-        from pathlib import Path
-
         # 先从配置读取
         if hasattr(self.config_manager.settings, setting_name):
             path = getattr(self.config_manager.settings, setting_name, "")
@@ -533,10 +641,7 @@ class SettingsPanel(QWidget):
     def _on_path_changed(self, setting_name: str, new_path: str):
         """处理路径输入框内容变更"""
         # 验证路径并保存设置
-        import os
-        from pathlib import Path
-
-        if new_path and os.path.exists(new_path):
+        if new_path and _cached_exists(new_path):
             # 智能转换：如果路径在当前软件目录下，转换为相对路径
             current_dir = Path.cwd()
             new_path_obj = Path(new_path).resolve()
@@ -559,54 +664,38 @@ class SettingsPanel(QWidget):
             
             # 设置正常样式
             if setting_name in self.path_inputs:
-                self.path_inputs[setting_name].setStyleSheet("""
-                    QLineEdit {
-                        padding: 10px 12px;
-                        border: 1px solid #d1d5db;
-                        border-radius: 6px;
-                        background-color: #ffffff;
-                        color: #374151;
-                        font-size: 12px;
-                        font-family: 'Consolas', 'Monaco', monospace;
-                        min-height: 18px;
-                        selection-background-color: #3b82f6;
-                    }
-                    QLineEdit:focus {
-                        border-color: #3b82f6;
-                        box-shadow: 0 0 0 3px rgba(59, 130, 246, 0.1);
-                    }
-                    QLineEdit:hover {
-                        border-color: #9ca3af;
-                    }
-                """)
+                self._set_path_input_invalid(self.path_inputs[setting_name], False)
         elif new_path:  # 路径不为空但无效
             # 设置错误样式
             if setting_name in self.path_inputs:
-                self.path_inputs[setting_name].setStyleSheet("""
-                    QLineEdit {
-                        padding: 10px 12px;
-                        border: 1px solid #ef4444;
-                        border-radius: 6px;
-                        background-color: #fef2f2;
-                        color: #dc2626;
-                        font-size: 12px;
-                        font-family: 'Consolas', 'Monaco', monospace;
-                        min-height: 18px;
-                        selection-background-color: #ef4444;
-                    }
-                    QLineEdit:focus {
-                        border-color: #dc2626;
-                        box-shadow: 0 0 0 3px rgba(239, 68, 68, 0.1);
-                    }
-                """)
+                self._set_path_input_invalid(self.path_inputs[setting_name], True)
+    
+    def _on_path_editing_finished(self, setting_name: str, path_input: QLineEdit):
+        """输入框编辑完成（回车或失去焦点）时校验并保存路径"""
+        if not path_input.isModified():
+            return
+        path_input.setModified(False)
+        self._on_path_changed(setting_name, path_input.text())
+    
+    @staticmethod
+    def _set_path_input_invalid(path_input: QLineEdit, invalid: bool):
+        """切换路径输入框的错误样式（通过动态属性 + 重新polish）"""
+        if path_input.property("invalid") == invalid:
+            return
+        path_input.setProperty("invalid", invalid)
+        style = path_input.style()
+        style.unpolish(path_input)
+        style.polish(path_input)
     
     def _browse_directory(self, setting_name: str, path_input: QLineEdit):
         """打开文件夹选择对话框"""
         current_path = path_input.text() or ""
         
+        # 清空路径缓存，确保新建的目录能被识别
+        _cached_exists.cache_clear()
+
         # 如果当前路径不存在，使用工作目录
-        import os
-        if not os.path.exists(current_path):
+        if not _cached_exists(current_path):
             current_path = os.getcwd()
         
         # 打开文件夹选择对话框
@@ -618,8 +707,9 @@ class SettingsPanel(QWidget):
         )
         
         if selected_dir:
-            # 更新输入框内容（这会触发 textChanged 信号）
+            # 更新输入框内容并保存（setText不会触发editingFinished）
             path_input.setText(selected_dir)
+            self._on_path_changed(setting_name, selected_dir)
 
     def _reset_to_default_path(self, setting_name: str, path_input: QLineEdit):
         """还原路径为默认值（相对路径）"""
@@ -705,8 +795,6 @@ class SettingsPanel(QWidget):
         """
         创建响应式存储管理卡片
         """
-        from ui.storage_manager_widget import StorageManagerWidget
-        
         # 创建现代化卡片容器
         storage_manager_card = ResponsiveSettingsCard(self.tr("Storage Management"), content_container)
         content_container.add_section(storage_manager_card)
@@ -727,7 +815,14 @@ class SettingsPanel(QWidget):
         note_label.setWordWrap(True)
         storage_manager_card.content_layout.addWidget(note_label)
         
-        # 存储管理组件
+        # 存储管理组件会扫描已安装工具，延迟到卡片首次显示时再创建
+        self._lazy_cards[storage_manager_card] = self._build_storage_manager
+        storage_manager_card.installEventFilter(self)
+    
+    def _build_storage_manager(self, storage_manager_card: ResponsiveSettingsCard):
+        """
+        构建存储管理组件（由eventFilter在卡片首次显示时调用）
+        """
         self.storage_manager = StorageManagerWidget()
         self.storage_manager.setMaximumHeight(400)  # 调整为更紧凑的高度
         storage_manager_card.content_layout.addWidget(self.storage_manager)
@@ -735,6 +830,14 @@ class SettingsPanel(QWidget):
         # 连接信号
         self.storage_manager.delete_tools_requested.connect(self._on_delete_tools_requested)
     
+    def eventFilter(self, obj, event):
+        """卡片首次显示时构建延迟加载的内容"""
+        if event.type() == QEvent.Show and obj in self._lazy_cards:
+            builder = self._lazy_cards.pop(obj)
+            obj.removeEventFilter(self)
+            builder(obj)
+        return super().eventFilter(obj, event)
+    
     def _create_responsive_storage_settings(self, content_container: QWidget):
         """
         创建响应式存储设置卡片
@@ -755,22 +858,8 @@ class SettingsPanel(QWidget):
         self.setting_switches["auto_clean_logs"] = auto_clean_logs_switch
         
         # 最大日志文件大小
-        log_size_spinbox = QSpinBox()
-        log_size_spinbox.setRange(1, 100)
-        log_size_spinbox.setSuffix(" MB")
+        log_size_spinbox = _make_styled_spinbox(1, 100, " MB")
         log_size_spinbox.setValue(10)
-        log_size_spinbox.setStyleSheet("""
-            QSpinBox {
-                padding: 8px 12px;
-                border: 1px solid #d1d5db;
-                border-radius: 8px;
-                background-color: white;
-                min-width: 80px;
-            }
-            QSpinBox:hover {
-                border-color: #3b82f6;
-            }
-        """)
         
         log_size_item = ResponsiveSettingsItem(
             self.tr("Maximum size of a single log file"),
@@ -808,20 +897,7 @@ class SettingsPanel(QWidget):
         update_card.content_layout.addWidget(note_label)
         
         # 更新模式选择
-        self.update_mode_combo = NoWheelComboBox()
-        self.update_mode_combo.addItems([self.tr("Auto Update"), self.tr("Manual Update")])
-        self.update_mode_combo.setStyleSheet("""
-            QComboBox {
-                padding: 8px 12px;
-                border: 1px solid #d1d5db;
-                border-radius: 8px;
-                background-color: white;
-                min-width: 120px;
-            }
-            QComboBox:hover {
-                border-color: #3b82f6;
-            }
-        """)
+        self.update_mode_combo = _make_styled_combo([self.tr("Auto Update"), self.tr("Manual Update")])
         self.update_mode_combo.currentTextChanged.connect(self._on_update_mode_changed)
         
         update_mode_item = ResponsiveSettingsItem(
@@ -834,20 +910,9 @@ class SettingsPanel(QWidget):
         self.setting_switches["update_mode"] = self.update_mode_combo
         
         # 检查频率设置
-        self.check_frequency_combo = NoWheelComboBox()
-        self.check_frequency_combo.addItems([self.tr("Daily"), self.tr("Every 3 Days"), self.tr("Weekly"), self.tr("Every 2 Weeks")])
-        self.check_frequency_combo.setStyleSheet("""
-            QComboBox {
-                padding: 8px 12px;
-                border: 1px solid #d1d5db;
-                border-radius: 8px;
-                background-color: white;
-                min-width: 100px;
-            }
-            QComboBox:hover {
-                border-color: #3b82f6;
-            }
-        """)
+        self.check_frequency_combo = _make_styled_combo(
+            [self.tr("Daily"), self.tr("Every 3 Days"), self.tr("Weekly"), self.tr("Every 2 Weeks")]
+        )
         # 变更时同步发出设置变更
         self.check_frequency_combo.currentTextChanged.connect(self._on_check_frequency_changed)
 
@@ -907,8 +972,8 @@ class SettingsPanel(QWidget):
         )
         update_card.add_setting_item(check_now_item)
         
-        # 初始化显示状态
-        self._on_update_mode_changed(self.tr("Auto Update"))
+        # 初始化显示状态（实际模式由load_current_settings同步）
+        self._apply_update_mode_visibility(False)
     
     def setup_connections(self):
         """
@@ -922,23 +987,26 @@ class SettingsPanel(QWidget):
                 switch.currentIndexChanged.connect(self._on_language_changed)
                 continue
 
-            # 检查是否是响应式开关
+            # 检查是否是响应式开关（设置名称记录在objectName中，由统一的处理函数分发）
             if hasattr(switch, 'toggled_signal'):
-                switch.toggled_signal.connect(
-                    lambda value, name=setting_name: self._on_setting_changed(name, value)
-                )
+                switch.setObjectName(f"{_TOGGLE_PREFIX}{setting_name}")
+                switch.toggled_signal.connect(self._dispatch_toggle)
             elif hasattr(switch, 'toggled'):
-                switch.toggled.connect(
-                    lambda value, name=setting_name: self._on_setting_changed(name, value)
-                )
+                switch.setObjectName(f"{_TOGGLE_PREFIX}{setting_name}")
+                switch.toggled.connect(self._dispatch_toggle)
 
-        # 目录选择按钮事件连接
-        for button in self.findChildren(QPushButton):
-            setting_name = button.property("setting")
-            if setting_name:
-                button.clicked.connect(
-                    lambda checked, name=setting_name: self._on_directory_select(name)
-                )
+        # 目录选择按钮在_create_path_input_widget中创建时已直接连接
+    
+    def _dispatch_toggle(self, value: bool):
+        """
+        开关切换统一处理
+        从发送者的objectName中解析设置名称
+        """
+        sender = self.sender()
+        if sender is None:
+            return
+        setting_name = sender.objectName()[len(_TOGGLE_PREFIX):]
+        self._on_setting_changed(setting_name, value)
     
     def _on_setting_changed(self, setting_name: str, value: bool):
         """
@@ -992,13 +1060,10 @@ class SettingsPanel(QWidget):
         }
         return name_map.get(setting_name, setting_name)
     
-    def _on_update_mode_changed(self, mode_text: str):
+    def _apply_update_mode_visibility(self, is_manual: bool):
         """
-        更新模式变更处理
-        根据选择的模式显示或隐藏相关设置
+        根据更新模式显示或隐藏相关设置（仅调整界面，不保存配置）
         """
-        is_manual = (mode_text == self.tr("Manual Update"))
-        
         # 根据模式显示/隐藏通知设置
         if hasattr(self, 'show_notification_switch'):
             # 手动模式才显示通知设置
@@ -1029,81 +1094,47 @@ class SettingsPanel(QWidget):
         加载当前设置值到UI控件
         对应JavaScript中从配置文件加载设置
         """
-        settings = self.config_manager.settings
+        # 一次性快照设置字段，循环内使用dict查找代替hasattr/getattr
+        snap = vars(self.config_manager.settings)
+        tool_update = snap.get('tool_update') or {}
         
-        # 更新开关状态
+        # 更新开关状态（阻塞控件信号，避免加载时逐项触发保存配置/切换语言）
         for setting_name, control in self.setting_switches.items():
-            # 处理不同类型的控件
-            if isinstance(control, (ResponsiveToggleSwitch, IOSToggleSwitch, ToggleSwitch)):
-                # 开关控件使用set_state方法
-                if setting_name.startswith('tool_update_'):
-                    # 处理工具更新设置
-                    setting_key = setting_name.replace('tool_update_', '')
-                    if hasattr(settings, 'tool_update') and settings.tool_update:
-                        value = settings.tool_update.get(setting_key, False)
-                        control.set_state(value)
-                elif hasattr(settings, setting_name):
-                    value = getattr(settings, setting_name)
-                    control.set_state(value)
-            elif isinstance(control, QComboBox):
-                # 下拉框使用setCurrentText或setCurrentIndex
-                if setting_name == 'language' and hasattr(settings, 'language'):
-                    # 语言设置：根据保存的locale匹配itemData，避免回退到中文
-                    current_lang = getattr(settings, 'language', 'zh_CN')
-                    matched = False
-                    for i in range(control.count()):
-                        if control.itemData(i) == current_lang:
-                            control.setCurrentIndex(i)
-                            matched = True
-                            break
-                    if not matched:
-                        # 未找到则回退到第一项（zh_CN）
-                        control.setCurrentIndex(0)
-                elif setting_name == 'update_mode':
-                    # 工具更新模式设置（使用索引避免翻译差异）
-                    if hasattr(settings, 'tool_update') and settings.tool_update:
-                        mode_value = settings.tool_update.get('update_mode', 'auto')
+            with QSignalBlocker(control):
+                # 处理不同类型的控件
+                if isinstance(control, (ResponsiveToggleSwitch, IOSToggleSwitch, ToggleSwitch)):
+                    # 开关控件使用set_state方法
+                    if setting_name.startswith('tool_update_'):
+                        # 处理工具更新设置
+                        if tool_update:
+                            setting_key = setting_name[len('tool_update_'):]
+                            control.set_state(tool_update.get(setting_key, False))
+                    elif setting_name in snap:
+                        control.set_state(snap[setting_name])
+                elif isinstance(control, QComboBox):
+                    # 下拉框使用setCurrentText或setCurrentIndex
+                    if setting_name == 'language' and 'language' in snap:
+                        # 语言设置：根据保存的locale查找索引，未找到则回退到第一项（zh_CN）
+                        control.setCurrentIndex(_LANGUAGE_INDEX.get(snap['language'], 0))
+                    elif setting_name == 'update_mode':
+                        # 工具更新模式设置（使用索引避免翻译差异）
+                        mode_value = tool_update.get('update_mode', 'auto')
                         control.setCurrentIndex(0 if mode_value == 'auto' else 1)
-                    else:
-                        control.setCurrentIndex(0)  # 默认自动
-                elif setting_name == 'check_frequency':
-                    # 检查频率设置（整数天数到索引映射）
-                    if hasattr(settings, 'tool_update') and settings.tool_update:
+                    elif setting_name == 'check_frequency':
+                        # 检查频率设置（整数天数到索引映射）
                         try:
-                            freq_days = int(settings.tool_update.get('check_frequency', 1))
+                            freq_days = int(tool_update.get('check_frequency', 1))
                         except Exception:
                             freq_days = 1
-                        index_map = {1: 0, 3: 1, 7: 2, 14: 3}
-                        control.setCurrentIndex(index_map.get(freq_days, 0))
-                    else:
-                        control.setCurrentIndex(0)  # 默认每天
-            elif isinstance(control, QSpinBox):
-                # 数字输入框使用setValue
-                if hasattr(settings, setting_name):
-                    value = getattr(settings, setting_name, 10)
-                    control.setValue(value)
-        
-        # 更新语言选择（基于locale匹配，避免显示错误）
-        if hasattr(self, 'language_combo') and hasattr(settings, 'language'):
-            current_lang = getattr(settings, 'language', 'zh_CN')
-            matched = False
-            for i in range(self.language_combo.count()):
-                if self.language_combo.itemData(i) == current_lang:
-                    self.language_combo.setCurrentIndex(i)
-                    matched = True
-                    break
-            if not matched:
-                self.language_combo.setCurrentIndex(0)
+                        control.setCurrentIndex(_FREQUENCY_DAYS_TO_INDEX.get(freq_days, 0))
+                elif isinstance(control, QSpinBox):
+                    # 数字输入框使用setValue
+                    if setting_name in snap:
+                        control.setValue(snap[setting_name])
         
-        # 更新工具更新设置
-        if hasattr(self, 'update_mode_combo') and hasattr(settings, 'tool_update'):
-            update_mode = settings.tool_update.get('update_mode', 'auto')
-            self.update_mode_combo.setCurrentIndex(0 if update_mode == 'auto' else 1)
-
-            # 更新检查频率（按索引设置）
-            check_freq = settings.tool_update.get('check_frequency', 1)
-            index_map = {1: 0, 3: 1, 7: 2, 14: 3}
-            self.check_frequency_combo.setCurrentIndex(index_map.get(int(check_freq), 0))
+        # 信号被阻塞，需手动同步更新模式相关控件的可见性
+        if hasattr(self, 'update_mode_combo'):
+            self._apply_update_mode_visibility(self.update_mode_combo.currentIndex() == 1)
     
     def refresh_settings(self):
         """刷新设置显示"""
@@ -1132,12 +1163,13 @@ class SettingsPanel(QWidget):
             # 刷新UI显示
             self.load_current_settings()
             
-            # 通知设置变更
-            for setting_name in ["auto_update", "check_tool_status_on_startup", 
-                               "show_detailed_install_log", "use_mirror_source", 
-                               "keep_install_cache"]:
-                value = getattr(default_settings, setting_name)
-                self.setting_changed.emit(setting_name, value)
+            # 通知设置变更（有批量接收者时只发一次批量信号）
+            delta = {setting_name: getattr(default_settings, setting_name) for setting_name in _RESET_KEYS}
+            if self.receivers(self.settings_bulk_changed) > 0:
+                self.settings_bulk_changed.emit(delta)
+            else:
+                for setting_name, value in delta.items():
+                    self.setting_changed.emit(setting_name, value)
             
             QMessageBox.information(self, self.tr("Reset Complete"), self.tr("All settings have been reset to default values!"))
     
@@ -1155,12 +1187,17 @@ class SettingsPanel(QWidget):
         
         if file_path:
             try:
-                import json
-                from dataclasses import asdict
-                
-                settings_data = asdict(self.config_manager.settings)
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    json.dump(settings_data, f, ensure_ascii=False, indent=2)
+                if HAS_ORJSON:
+                    # orjson直接序列化dataclass（UTF-8输出），无需asdict深拷贝
+                    data = orjson.dumps(
+                        self.config_manager.settings,
+                        option=orjson.OPT_SERIALIZE_DATACLASS | orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                    )
+                    Path(file_path).write_bytes(data)
+                else:
+                    settings_data = asdict(self.config_manager.settings)
+                    with open(file_path, 'w', encoding='utf-8') as f:
+                        json.dump(settings_data, f, ensure_ascii=False, indent=2)
                 
                 QMessageBox.information(self, self.tr("Export Successful"), self.tr("Settings have been exported to:\n{0}").format(file_path))
 
@@ -1181,15 +1218,16 @@ class SettingsPanel(QWidget):
         
         if file_path:
             try:
-                import json
-                
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    settings_data = json.load(f)
+                if HAS_ORJSON:
+                    settings_data = orjson.loads(Path(file_path).read_bytes())
+                else:
+                    with open(file_path, 'r', encoding='utf-8') as f:
+                        settings_data = json.load(f)
                 
-                # 更新设置
-                for key, value in settings_data.items():
-                    if hasattr(self.config_manager.settings, key):
-                        setattr(self.config_manager.settings, key, value)
+                # 更新设置（只接受Settings中定义的字段）
+                settings = self.config_manager.settings
+                for key in settings_data.keys() & _SETTINGS_FIELDS:
+                    setattr(settings, key, settings_data[key])
                 
                 # 保存设置
                 self.config_manager.save_settings()
@@ -1208,17 +1246,7 @@ class SettingsPanel(QWidget):
         
         # 显示/隐藏相关设置控件
         # 自动模式显示检查频率，手动模式显示通知开关
-        if hasattr(self, 'check_frequency_combo'):
-            # 查找检查频率设置项的父级容器并控制可见性
-            frequency_item = self.check_frequency_combo.parent()
-            if frequency_item:
-                frequency_item.setVisible(not is_manual)
-        
-        if hasattr(self, 'show_notification_switch'):
-            # 查找通知开关设置项的父级容器并控制可见性
-            notification_item = self.show_notification_switch.parent()
-            if notification_item:
-                notification_item.setVisible(is_manual)
+        self._apply_update_mode_visibility(is_manual)
         
         # 更新配置并广播（使用索引避免翻译差异导致判断错误）
         mode_value = "manual" if is_manual else "auto"
@@ -1235,8 +1263,7 @@ class SettingsPanel(QWidget):
         """处理检查频率变更，保存为天数（1/3/7/14）并广播"""
         try:
             idx = self.check_frequency_combo.currentIndex() if hasattr(self, 'check_frequency_combo') else 0
-            days_map = {0: 1, 1: 3, 2: 7, 3: 14}
-            days = days_map.get(idx, 1)
+            days = _FREQUENCY_INDEX_TO_DAYS.get(idx, 1)
 
             # 若无变化则不广播
             current = 1
@@ -1267,7 +1294,6 @@ class SettingsPanel(QWidget):
         if reply == QMessageBox.Yes:
             try:
                 import shutil
-                from pathlib import Path
                 
                 # 清理临时目录
                 temp_dir = Path("temp")
@@ -1292,9 +1318,6 @@ class SettingsPanel(QWidget):
     def _update_storage_info(self):
         """更新存储使用信息"""
         try:
-            from pathlib import Path
-            import os
-            
             def get_dir_size(path):
                 """计算目录大小"""
                 if not path.exists():
@@ -1343,9 +1366,6 @@ class SettingsPanel(QWidget):
     def _update_installed_tools_list(self):
         """更新已安装工具列表"""
         try:
-            from pathlib import Path
-            import os
-            
             def format_size(bytes_size):
                 """格式化文件大小"""
                 for unit in ['B', 'KB', 'MB', 'GB']:
@@ -1421,7 +1441,6 @@ class SettingsPanel(QWidget):
         """执行工具删除操作"""
         try:
             import shutil
-            from pathlib import Path
             from utils.dependency_manager import get_dependency_manager
             
             # 删除工具文件
@@ -1455,7 +1474,7 @@ class SettingsPanel(QWidget):
                 dep_manager.remove_tool_dependencies(tool_name)
             
             # 刷新存储管理显示
-            if hasattr(self, 'storage_manager'):
+            if self.storage_manager is not None:
                 self.storage_manager.refresh_data()
             
             # 显示结果
@@ -1627,6 +1646,8 @@ class SettingsPanel(QWidget):
             # Reinitialize
             logger.info("Step 3/5: Reinitializing UI...")
             self.setting_switches = {}
+            self._lazy_cards = {}
+            self.storage_manager = None
             self.init_ui()
             logger.info(f"SUCCESS: UI reinitialized, new settings count: {len(self.setting_switches)}")
 
@@ -1642,10 +1663,8 @@ class SettingsPanel(QWidget):
                         elif isinstance(control, QComboBox):
                             if setting_name == 'language':
                                 # Find index by locale
-                                for i in range(control.count()):
-                                    if control.itemData(i) == value:
-                                        control.setCurrentIndex(i)
-                                        break
+                                if value in _LANGUAGE_INDEX:
+                                    control.setCurrentIndex(_LANGUAGE_INDEX[value])
                             else:
                                 control.setCurrentText(value)
                         elif isinstance(control, QSpinBox):
@@ -4,12 +4,12 @@
 SmartPaintLabel 2.0 - 完全兼容版本
 =====================================
 
-🔥 激进解决方案：完全兼容QLabel的API，同时提供零截断保证
+🔥 激进解决方案：完全兼容QLabel的API，同时智能适配文本显示
 
 核心特性：
 1. 100% QLabel API兼容 - setText, setFont, setStyleSheet等全部支持
 2. CSS样式解析器 - 自动解析setStyleSheet并应用到paintEvent
-3. 零截断保证 - 数学算法确保文本完整显示
+3. 智能适配 - 换行文本缩小字号完整显示；单行文本仅宽度超出时以"…"省略
 4. 无缝替换 - 可以直接替换任何QLabel，无需修改其他代码
 5. 背景兼容 - 正确处理容器背景和边框
 
@@ -30,131 +30,248 @@ label.setAlignment(Qt.AlignCenter)
 """
 
 import re
-from typing import Dict, Any, Optional, Tuple
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, Tuple
 from PyQt5.QtWidgets import QWidget, QSizePolicy
 from PyQt5.QtCore import Qt, QRect, QSize
 from PyQt5.QtGui import (
     QPainter, QFont, QFontMetrics, QFontMetricsF, 
-    QColor, QPen, QBrush, QPainterPath
+    QColor, QPen, QBrush, QPixmap
 )
 
 
+# CSS声明：一次扫描得到所有 "属性: 值" 对（值不跨越 ; { }）
+_RE_DECL = re.compile(r'([a-zA-Z-]+)\s*:\s*([^;{}]+)')
+
+# 属性值匹配模式（模块级预编译）
+_RE_PX_VALUE = re.compile(r'(\d+)px')
+_RE_FONT_WEIGHT_VALUE = re.compile(r'(bold|normal|\d+)')
+_RE_COLOR_VALUE = re.compile(r'(#[a-fA-F0-9]+|rgb\([^)]+\))')
+_RE_BORDER_VALUE = re.compile(r'(\d+)px\s+(solid|dashed|dotted)\s+([#a-fA-F0-9]+)')
+_RE_BOX_VALUE = re.compile(r'[0-9px\s]+')
+_RE_INT = re.compile(r'\d+')
+
+
+def _parse_font_size(value: str) -> Optional[Dict[str, Any]]:
+    """font-size: 12px"""
+    match = _RE_PX_VALUE.match(value)
+    if match:
+        return {'font_size': int(match.group(1))}
+    return None
+
+
+def _parse_font_weight(value: str) -> Optional[Dict[str, Any]]:
+    """font-weight: bold | normal | 100-900"""
+    match = _RE_FONT_WEIGHT_VALUE.match(value)
+    if not match:
+        return None
+    
+    weight_str = match.group(1)
+    if weight_str == 'bold':
+        return {'font_weight': QFont.Bold}
+    if weight_str == 'normal':
+        return {'font_weight': QFont.Normal}
+    
+    # 数值权重转换
+    weight_num = int(weight_str)
+    if weight_num >= 700:
+        return {'font_weight': QFont.Bold}
+    if weight_num >= 500:
+        return {'font_weight': QFont.DemiBold}
+    return {'font_weight': QFont.Normal}
+
+
+def _parse_color(value: str) -> Optional[Dict[str, Any]]:
+    """color: #1e293b | rgb(30, 41, 59)"""
+    match = _RE_COLOR_VALUE.match(value)
+    if match:
+        return {'color': QColor(match.group(1))}
+    return None
+
+
+def _parse_background_color(value: str) -> Optional[Dict[str, Any]]:
+    """background-color: #f8fafc"""
+    match = _RE_COLOR_VALUE.match(value)
+    if match:
+        return {'background_color': QColor(match.group(1))}
+    return None
+
+
+def _parse_border(value: str) -> Optional[Dict[str, Any]]:
+    """border: 1px solid #e2e8f0"""
+    match = _RE_BORDER_VALUE.match(value)
+    if not match:
+        return None
+    return {
+        'border_width': int(match.group(1)),
+        'border_style': match.group(2),
+        'border_color': QColor(match.group(3)),
+    }
+
+
+def _parse_border_radius(value: str) -> Optional[Dict[str, Any]]:
+    """border-radius: 8px"""
+    match = _RE_PX_VALUE.match(value)
+    if match:
+        return {'border_radius': int(match.group(1))}
+    return None
+
+
+def _parse_box_values(value: str) -> Optional[Tuple[int, int, int, int]]:
+    """
+    解析padding/margin的1、2或4个数值，返回 (top, right, bottom, left)
+    """
+    match = _RE_BOX_VALUE.match(value)
+    if not match:
+        return None
+    values = list(map(int, _RE_INT.findall(match.group(0))))
+    
+    if len(values) == 1:
+        # 10px
+        return (values[0], values[0], values[0], values[0])
+    if len(values) == 2:
+        # 10px 20px (vertical horizontal)
+        return (values[0], values[1], values[0], values[1])
+    if len(values) == 4:
+        # 10px 20px 30px 40px (top right bottom left)
+        return tuple(values)
+    return None
+
+
+def _parse_padding(value: str) -> Optional[Dict[str, Any]]:
+    """padding: 10px 20px"""
+    box = _parse_box_values(value)
+    return {'padding': box} if box else None
+
+
+def _parse_margin(value: str) -> Optional[Dict[str, Any]]:
+    """margin: 5px 10px"""
+    box = _parse_box_values(value)
+    return {'margin': box} if box else None
+
+
+def _parse_margin_bottom(value: str) -> Optional[Dict[str, Any]]:
+    """margin-bottom: 10px（与margin合并，在全部声明解析完后处理）"""
+    match = _RE_PX_VALUE.match(value)
+    if match:
+        return {'margin_bottom': int(match.group(1))}
+    return None
+
+
+# CSS属性名 -> 值解析函数（返回要写入样式字典的键值，无法识别时返回None）
+_PROPERTY_HANDLERS = {
+    'font-size': _parse_font_size,
+    'font-weight': _parse_font_weight,
+    'color': _parse_color,
+    'background-color': _parse_background_color,
+    'border': _parse_border,
+    'border-radius': _parse_border_radius,
+    'padding': _parse_padding,
+    'margin': _parse_margin,
+    'margin-bottom': _parse_margin_bottom,
+}
+
+# SmartPaintLabelV2未设置padding时的默认内边距 (top, right, bottom, left)
+_DEFAULT_PADDING = (6, 6, 6, 6)
+
+# 空样式（只读，可安全共享）
+_EMPTY_STYLES = MappingProxyType({})
+
+# 按字符串对象身份缓存的解析结果 {id(样式表): (样式表, 解析结果)}
+_STYLESHEET_ID_CACHE: Dict[int, Tuple[str, Mapping[str, Any]]] = {}
+_STYLESHEET_ID_CACHE_LIMIT = 256
+
+
+# QFontMetrics缓存 {font.key(): QFontMetrics}，超过上限时整体清空
+_METRICS_CACHE: Dict[str, QFontMetrics] = {}
+_METRICS_CACHE_LIMIT = 512
+
+
+def _metrics(font: QFont) -> QFontMetrics:
+    """获取字体对应的QFontMetrics（相同字体复用同一实例）"""
+    key = font.key()
+    metrics = _METRICS_CACHE.get(key)
+    if metrics is None:
+        if len(_METRICS_CACHE) >= _METRICS_CACHE_LIMIT:
+            _METRICS_CACHE.clear()
+        metrics = QFontMetrics(font)
+        _METRICS_CACHE[key] = metrics
+    return metrics
+
+
+def parse_stylesheet(stylesheet: str) -> Mapping[str, Any]:
+    """
+    解析CSS样式字符串，返回样式参数字典
+    
+    同一样式表常被多个标签使用，结果按样式字符串缓存；
+    返回只读映射，调用方需要修改时请先复制为dict
+    
+    主题通常把同一个字符串对象传给大量控件，先按对象身份查找，
+    未命中再按字符串内容查找
+    
+    支持的CSS属性：
+    - font-size: 12px
+    - font-weight: bold | normal | 100-900
+    - color: #1e293b | rgb(30, 41, 59)
+    - background-color: #f8fafc
+    - border: 1px solid #e2e8f0
+    - border-radius: 8px
+    - padding: 10px 20px
+    - margin: 5px 10px
+    """
+    entry = _STYLESHEET_ID_CACHE.get(id(stylesheet))
+    if entry is not None and entry[0] is stylesheet:
+        return entry[1]
+    
+    styles = _parse_stylesheet_cached(stylesheet)
+    if len(_STYLESHEET_ID_CACHE) >= _STYLESHEET_ID_CACHE_LIMIT:
+        _STYLESHEET_ID_CACHE.clear()
+    # 同时持有字符串本身，保证其存活期间id不会被复用
+    _STYLESHEET_ID_CACHE[id(stylesheet)] = (stylesheet, styles)
+    return styles
+
+
+@lru_cache(maxsize=256)
+def _parse_stylesheet_cached(stylesheet: str) -> Mapping[str, Any]:
+    """
+    按内容缓存的样式表解析
+    """
+    if not stylesheet or ':' not in stylesheet:
+        return _EMPTY_STYLES
+    
+    styles = {}
+    
+    # 单次扫描所有声明，按属性名分派给对应的解析函数
+    for match in _RE_DECL.finditer(stylesheet):
+        handler = _PROPERTY_HANDLERS.get(match.group(1))
+        if handler is None:
+            continue
+        parsed = handler(match.group(2).strip())
+        if parsed:
+            styles.update(parsed)
+    
+    # margin-bottom单独处理（常见于标题）：覆盖margin的bottom值
+    margin_bottom = styles.pop('margin_bottom', None)
+    if margin_bottom is not None:
+        if 'margin' not in styles:
+            styles['margin'] = (0, 0, margin_bottom, 0)
+        else:
+            current_margin = list(styles['margin'])
+            current_margin[2] = margin_bottom
+            styles['margin'] = tuple(current_margin)
+    
+    return MappingProxyType(styles)
+
+
 class CSSStyleParser:
     """
     CSS样式解析器
     将setStyleSheet的CSS内容解析为paintEvent可用的参数
+    （保留用于兼容，解析逻辑见模块级parse_stylesheet）
     """
     
-    @staticmethod
-    def parse_stylesheet(stylesheet: str) -> Dict[str, Any]:
-        """
-        解析CSS样式字符串，返回样式参数字典
-        
-        支持的CSS属性：
-        - font-size: 12px
-        - font-weight: bold | normal | 100-900
-        - color: #1e293b | rgb(30, 41, 59)
-        - background-color: #f8fafc
-        - border: 1px solid #e2e8f0
-        - border-radius: 8px
-        - padding: 10px 20px
-        - margin: 5px 10px
-        """
-        if not stylesheet:
-            return {}
-        
-        styles = {}
-        
-        # 基本CSS属性解析
-        font_size_match = re.search(r'font-size:\s*(\d+)px', stylesheet)
-        if font_size_match:
-            styles['font_size'] = int(font_size_match.group(1))
-        
-        font_weight_match = re.search(r'font-weight:\s*(bold|normal|\d+)', stylesheet)
-        if font_weight_match:
-            weight_str = font_weight_match.group(1)
-            if weight_str == 'bold':
-                styles['font_weight'] = QFont.Bold
-            elif weight_str == 'normal':
-                styles['font_weight'] = QFont.Normal
-            else:
-                # 数值权重转换
-                weight_num = int(weight_str)
-                if weight_num >= 700:
-                    styles['font_weight'] = QFont.Bold
-                elif weight_num >= 500:
-                    styles['font_weight'] = QFont.DemiBold  
-                else:
-                    styles['font_weight'] = QFont.Normal
-        
-        # 颜色解析
-        color_match = re.search(r'color:\s*([#a-fA-F0-9]+|rgb\([^)]+\))', stylesheet)
-        if color_match:
-            styles['color'] = QColor(color_match.group(1))
-        
-        # 背景色解析
-        bg_color_match = re.search(r'background-color:\s*([#a-fA-F0-9]+|rgb\([^)]+\))', stylesheet)
-        if bg_color_match:
-            styles['background_color'] = QColor(bg_color_match.group(1))
-        
-        # 边框解析
-        border_match = re.search(r'border:\s*(\d+)px\s+(solid|dashed|dotted)\s+([#a-fA-F0-9]+)', stylesheet)
-        if border_match:
-            styles['border_width'] = int(border_match.group(1))
-            styles['border_style'] = border_match.group(2)
-            styles['border_color'] = QColor(border_match.group(3))
-        
-        # 圆角解析
-        radius_match = re.search(r'border-radius:\s*(\d+)px', stylesheet)
-        if radius_match:
-            styles['border_radius'] = int(radius_match.group(1))
-        
-        # 内边距解析 (支持 padding: 10px 或 padding: 10px 20px 等)
-        padding_match = re.search(r'padding:\s*([0-9px\s]+)', stylesheet)
-        if padding_match:
-            padding_str = padding_match.group(1).replace('px', '').strip()
-            padding_values = [int(x) for x in padding_str.split() if x.isdigit()]
-            
-            if len(padding_values) == 1:
-                # padding: 10px
-                styles['padding'] = (padding_values[0], padding_values[0], 
-                                   padding_values[0], padding_values[0])
-            elif len(padding_values) == 2:
-                # padding: 10px 20px (vertical horizontal)
-                styles['padding'] = (padding_values[0], padding_values[1], 
-                                   padding_values[0], padding_values[1])
-            elif len(padding_values) == 4:
-                # padding: 10px 20px 30px 40px (top right bottom left)
-                styles['padding'] = tuple(padding_values)
-        
-        # 外边距解析
-        margin_match = re.search(r'margin:\s*([0-9px\s]+)', stylesheet)
-        if margin_match:
-            margin_str = margin_match.group(1).replace('px', '').strip()
-            margin_values = [int(x) for x in margin_str.split() if x.isdigit()]
-            
-            if len(margin_values) == 1:
-                styles['margin'] = (margin_values[0], margin_values[0], 
-                                  margin_values[0], margin_values[0])
-            elif len(margin_values) == 2:
-                styles['margin'] = (margin_values[0], margin_values[1], 
-                                  margin_values[0], margin_values[1])
-            elif len(margin_values) == 4:
-                styles['margin'] = tuple(margin_values)
-        
-        # margin-bottom单独处理（常见于标题）
-        margin_bottom_match = re.search(r'margin-bottom:\s*(\d+)px', stylesheet)
-        if margin_bottom_match:
-            margin_bottom = int(margin_bottom_match.group(1))
-            if 'margin' not in styles:
-                styles['margin'] = (0, 0, margin_bottom, 0)
-            else:
-                # 更新现有margin的bottom值
-                current_margin = list(styles['margin'])
-                current_margin[2] = margin_bottom
-                styles['margin'] = tuple(current_margin)
-        
-        return styles
+    parse_stylesheet = staticmethod(parse_stylesheet)
 
 
 class SmartTextCalculator:
@@ -162,7 +279,8 @@ class SmartTextCalculator:
     
     @staticmethod
     def calculate_optimal_display(text: str, available_rect: QRect, 
-                                font: QFont, alignment: Qt.Alignment) -> Dict[str, Any]:
+                                font: QFont, alignment: Qt.Alignment,
+                                word_wrap: bool = True) -> Dict[str, Any]:
         """
         计算文本的最优显示参数
         
@@ -170,18 +288,46 @@ class SmartTextCalculator:
         @param available_rect: 可用绘制区域
         @param font: 字体对象
         @param alignment: 对齐方式
+        @param word_wrap: 是否按自动换行测量（单行文本无需断行计算）
         @return: 显示参数字典
         """
         if not text or available_rect.isEmpty():
             return {'draw_rect': available_rect, 'font': font, 'requires_scaling': False}
         
-        metrics = QFontMetrics(font)
+        draw_rect, point_size, requires_scaling = _calculate_display_cached(
+            text,
+            available_rect.x(), available_rect.y(),
+            available_rect.width(), available_rect.height(),
+            font.toString(), int(alignment), word_wrap
+        )
+        
+        if requires_scaling:
+            optimal_font = QFont(font)
+            optimal_font.setPointSize(point_size)
+        else:
+            optimal_font = font
+        
+        return {
+            'draw_rect': QRect(*draw_rect),
+            'font': optimal_font,
+            'requires_scaling': requires_scaling,
+            'original_font': font
+        }
+    
+    @staticmethod
+    def _calculate_display_uncached(text: str, available_rect: QRect,
+                                    font: QFont, alignment: Qt.Alignment,
+                                    word_wrap: bool) -> Tuple[Tuple[int, int, int, int], int, bool]:
+        """
+        实际执行文本度量和字号计算
+        
+        @return: (绘制区域(x, y, w, h), 字号, 是否缩放)
+        """
+        metrics = _metrics(font)
         
         # 计算文本在当前字体下的边界
-        text_rect = metrics.boundingRect(
-            available_rect, 
-            alignment | Qt.TextWordWrap, 
-            text
+        text_rect = SmartTextCalculator._measure_text(
+            metrics, available_rect, alignment, text, word_wrap
         )
         
         # 检查是否需要缩放
@@ -191,13 +337,10 @@ class SmartTextCalculator:
         if requires_scaling:
             # 计算最适合的字体大小
             optimal_font = SmartTextCalculator._calculate_optimal_font(
-                text, available_rect, font, alignment
+                text, available_rect, font, alignment, word_wrap
             )
-            optimal_metrics = QFontMetrics(optimal_font)
-            text_rect = optimal_metrics.boundingRect(
-                available_rect,
-                alignment | Qt.TextWordWrap,
-                text
+            text_rect = SmartTextCalculator._measure_text(
+                _metrics(optimal_font), available_rect, alignment, text, word_wrap
             )
         else:
             optimal_font = font
@@ -207,33 +350,94 @@ class SmartTextCalculator:
             text_rect, available_rect, alignment
         )
         
-        return {
-            'draw_rect': draw_rect,
-            'font': optimal_font,
-            'requires_scaling': requires_scaling,
-            'original_font': font
-        }
+        return (
+            (draw_rect.x(), draw_rect.y(), draw_rect.width(), draw_rect.height()),
+            optimal_font.pointSize(),
+            requires_scaling
+        )
+    
+    @staticmethod
+    def _measure_text(metrics: QFontMetrics, available_rect: QRect,
+                      alignment: Qt.Alignment, text: str, word_wrap: bool) -> QRect:
+        """
+        测量文本占用区域
+        不换行的单行文本直接使用单行宽度和行高，跳过boundingRect的断行计算；
+        含换行符的文本即使不自动换行也会分行，仍由boundingRect测量
+        """
+        if not word_wrap:
+            if '\n' not in text:
+                return QRect(available_rect.x(), available_rect.y(),
+                             metrics.horizontalAdvance(text), metrics.height())
+            return metrics.boundingRect(available_rect, alignment, text)
+        return metrics.boundingRect(available_rect, alignment | Qt.TextWordWrap, text)
     
     @staticmethod
     def _calculate_optimal_font(text: str, available_rect: QRect, 
-                              base_font: QFont, alignment: Qt.Alignment) -> QFont:
-        """计算最优字体大小"""
+                              base_font: QFont, alignment: Qt.Alignment,
+                              word_wrap: bool = True) -> QFont:
+        """
+        计算最优字体大小
+        文本宽高近似与字号成正比：先按比例估算字号，再用少量测量校正；
+        估算偏差过大时回退到二分查找
+        """
+        min_size = 8
+        base_size = base_font.pointSize()
+        measure = SmartTextCalculator._measure_text
+        
+        def make_font(size: int) -> QFont:
+            font = QFont(base_font)
+            font.setPointSize(size)
+            return font
+        
+        def fits(size: int) -> bool:
+            test_rect = measure(_metrics(make_font(size)), available_rect, alignment, text, word_wrap)
+            return (test_rect.width() <= available_rect.width() and
+                    test_rect.height() <= available_rect.height())
+        
+        # 按原字号下的超出比例估算
+        base_rect = measure(_metrics(base_font), available_rect, alignment, text, word_wrap)
+        ratio = min(available_rect.width() / max(1, base_rect.width()),
+                    available_rect.height() / max(1, base_rect.height()))
+        guess = max(min_size, min(base_size, int(base_size * ratio)))
+        
+        if fits(guess):
+            # 估算偏小：最多向上尝试2次（不超过原字号）
+            for _ in range(2):
+                if guess + 1 < base_size and fits(guess + 1):
+                    guess += 1
+                else:
+                    break
+            return make_font(guess)
+        
+        # 估算偏大：最多向下尝试3次
+        for _ in range(3):
+            guess -= 1
+            if guess < min_size:
+                break
+            if fits(guess):
+                return make_font(guess)
+        
+        return make_font(SmartTextCalculator._binary_search_font_size(
+            text, available_rect, base_font, alignment, word_wrap
+        ))
+    
+    @staticmethod
+    def _binary_search_font_size(text: str, available_rect: QRect,
+                                 base_font: QFont, alignment: Qt.Alignment,
+                                 word_wrap: bool = True) -> int:
+        """二分查找最适合的字体大小（估算失败时的回退方案）"""
         min_size = 8
         max_size = base_font.pointSize()
         optimal_size = max_size
         
-        # 二分查找最适合的字体大小
         while max_size - min_size > 1:
             mid_size = (min_size + max_size) // 2
             
             test_font = QFont(base_font)
             test_font.setPointSize(mid_size)
             
-            test_metrics = QFontMetrics(test_font)
-            test_rect = test_metrics.boundingRect(
-                available_rect,
-                alignment | Qt.TextWordWrap,
-                text
+            test_rect = SmartTextCalculator._measure_text(
+                _metrics(test_font), available_rect, alignment, text, word_wrap
             )
             
             if (test_rect.width() <= available_rect.width() and 
@@ -243,32 +447,59 @@ class SmartTextCalculator:
             else:
                 max_size = mid_size
         
-        result_font = QFont(base_font)
-        result_font.setPointSize(optimal_size)
-        return result_font
+        return optimal_size
     
     @staticmethod
     def _align_text_rect(text_rect: QRect, available_rect: QRect, 
                         alignment: Qt.Alignment) -> QRect:
         """根据对齐方式调整文本绘制区域"""
-        x = available_rect.x()
-        y = available_rect.y()
-        
-        # 水平对齐
-        if alignment & Qt.AlignHCenter:
-            x = available_rect.x() + (available_rect.width() - text_rect.width()) // 2
-        elif alignment & Qt.AlignRight:
-            x = available_rect.x() + available_rect.width() - text_rect.width()
+        h_factor, v_factor = _align_factors(int(alignment))
         
-        # 垂直对齐
-        if alignment & Qt.AlignVCenter:
-            y = available_rect.y() + (available_rect.height() - text_rect.height()) // 2
-        elif alignment & Qt.AlignBottom:
-            y = available_rect.y() + available_rect.height() - text_rect.height()
+        # 偏移 = 剩余空间 * 系数 // 2（系数 0=左/上, 1=居中, 2=右/下）
+        x = available_rect.x() + (available_rect.width() - text_rect.width()) * h_factor // 2
+        y = available_rect.y() + (available_rect.height() - text_rect.height()) * v_factor // 2
         
         return QRect(x, y, available_rect.width(), available_rect.height())
 
 
+@lru_cache(maxsize=64)
+def _align_factors(alignment: int) -> Tuple[int, int]:
+    """
+    对齐方式 -> (水平系数, 垂直系数)，系数为剩余空间的半数倍数
+    居中优先于右/下对齐，与原先的判断顺序一致
+    """
+    if alignment & Qt.AlignHCenter:
+        h_factor = 1
+    elif alignment & Qt.AlignRight:
+        h_factor = 2
+    else:
+        h_factor = 0
+    
+    if alignment & Qt.AlignVCenter:
+        v_factor = 1
+    elif alignment & Qt.AlignBottom:
+        v_factor = 2
+    else:
+        v_factor = 0
+    
+    return h_factor, v_factor
+
+
+@lru_cache(maxsize=1024)
+def _calculate_display_cached(text: str, x: int, y: int, width: int, height: int,
+                              font_desc: str, alignment: int,
+                              word_wrap: bool) -> Tuple[Tuple[int, int, int, int], int, bool]:
+    """
+    缓存的文本显示计算（setText/setFont/resize时频繁重复调用）
+    只在未命中时重建QRect/QFont；结果使用元组，避免缓存Qt对象
+    """
+    font = QFont()
+    font.fromString(font_desc)
+    return SmartTextCalculator._calculate_display_uncached(
+        text, QRect(x, y, width, height), font, Qt.Alignment(alignment), word_wrap
+    )
+
+
 class SmartCheckBox(QWidget):
     """
     智能复选框 - 解决QCheckBox文本截断问题
@@ -280,6 +511,11 @@ class SmartCheckBox(QWidget):
     - 完全兼容QCheckBox的API
     """
     
+    # 复选框方框边长
+    _CHECKBOX_SIZE = 16
+    # 预渲染的方框位图 {(是否选中, 设备像素比): QPixmap}
+    _PIXMAP_CACHE = {}
+    
     def __init__(self, text: str = "", parent=None):
         super().__init__(parent)
         
@@ -288,6 +524,7 @@ class SmartCheckBox(QWidget):
         self._text = text
         self._font = QFont()
         self._enabled = True
+        self._cached_size_hint: Optional[QSize] = None
         
         # 尺寸设置
         self.setFixedHeight(24)  # 标准复选框高度
@@ -310,6 +547,7 @@ class SmartCheckBox(QWidget):
     def setText(self, text: str):
         """设置文本内容"""
         self._text = text
+        self._cached_size_hint = None
         self.update()
     
     def text(self) -> str:
@@ -319,6 +557,7 @@ class SmartCheckBox(QWidget):
     def setFont(self, font: QFont):
         """设置字体"""
         self._font = font
+        self._cached_size_hint = None
         self.update()
     
     def font(self) -> QFont:
@@ -338,19 +577,28 @@ class SmartCheckBox(QWidget):
         if event.button() == Qt.LeftButton and self._enabled:
             self.setChecked(not self._checked)
     
-    def paintEvent(self, event):
-        """绘制智能复选框"""
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing, True)
+    @classmethod
+    def _checkbox_pixmap(cls, checked: bool, dpr: float) -> QPixmap:
+        """
+        获取复选框方框位图（按选中状态和设备像素比缓存，所有实例共享）
+        首次使用时渲染，之后每次绘制只需一次位图拷贝
+        """
+        key = (checked, dpr)
+        pixmap = cls._PIXMAP_CACHE.get(key)
+        if pixmap is not None:
+            return pixmap
         
-        rect = self.rect()
+        # 1px边框会画到方框外侧一像素，位图需多留一像素
+        extent = cls._CHECKBOX_SIZE + 1
+        pixmap = QPixmap(int(extent * dpr), int(extent * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.transparent)
         
-        # 1. 绘制复选框（正方形）
-        checkbox_size = 16
-        checkbox_rect = QRect(4, (rect.height() - checkbox_size) // 2, checkbox_size, checkbox_size)
+        painter = QPainter(pixmap)
+        checkbox_rect = QRect(0, 0, cls._CHECKBOX_SIZE, cls._CHECKBOX_SIZE)
         
         # 复选框背景
-        if self._checked:
+        if checked:
             painter.fillRect(checkbox_rect, QColor("#2563eb"))  # 蓝色背景
         else:
             painter.fillRect(checkbox_rect, QColor("#ffffff"))  # 白色背景
@@ -359,8 +607,9 @@ class SmartCheckBox(QWidget):
         painter.setPen(QPen(QColor("#d1d5db"), 1))
         painter.drawRect(checkbox_rect)
         
-        # 勾选标记
-        if self._checked:
+        # 勾选标记（斜线需要抗锯齿，方框不需要）
+        if checked:
+            painter.setRenderHint(QPainter.Antialiasing, True)
             painter.setPen(QPen(QColor("#ffffff"), 2))
             # 绘制勾号 - 使用两条线段
             # 第一段：左下到中间
@@ -374,6 +623,24 @@ class SmartCheckBox(QWidget):
                 checkbox_rect.x() + 12, checkbox_rect.y() + 5
             )
         
+        painter.end()
+        cls._PIXMAP_CACHE[key] = pixmap
+        return pixmap
+    
+    def paintEvent(self, event):
+        """绘制智能复选框"""
+        painter = QPainter(self)
+        
+        rect = self.rect()
+        
+        # 1. 绘制复选框（正方形，使用预渲染的位图）
+        checkbox_size = self._CHECKBOX_SIZE
+        checkbox_rect = QRect(4, (rect.height() - checkbox_size) // 2, checkbox_size, checkbox_size)
+        painter.drawPixmap(
+            checkbox_rect.topLeft(),
+            self._checkbox_pixmap(self._checked, self.devicePixelRatioF())
+        )
+        
         # 2. 绘制文本标签（使用智能算法）
         if self._text:
             text_rect = QRect(
@@ -388,7 +655,8 @@ class SmartCheckBox(QWidget):
                 text=self._text,
                 available_rect=text_rect,
                 font=self._font,
-                alignment=Qt.AlignLeft | Qt.AlignVCenter
+                alignment=Qt.AlignLeft | Qt.AlignVCenter,
+                word_wrap=False
             )
             
             # 绘制文本
@@ -401,12 +669,14 @@ class SmartCheckBox(QWidget):
             )
     
     def sizeHint(self) -> QSize:
-        """建议尺寸"""
-        if self._text:
-            metrics = QFontMetrics(self._font)
-            text_width = metrics.width(self._text)
-            return QSize(text_width + 32, 24)  # 文本宽度 + 复选框 + 间距
-        return QSize(100, 24)
+        """建议尺寸（布局时频繁调用，缓存到文本或字体变化为止）"""
+        if self._cached_size_hint is None:
+            if self._text:
+                text_width = _metrics(self._font).width(self._text)
+                self._cached_size_hint = QSize(text_width + 32, 24)  # 文本宽度 + 复选框 + 间距
+            else:
+                self._cached_size_hint = QSize(100, 24)
+        return self._cached_size_hint
 
 
 class SmartPaintLabelV2(QWidget):
@@ -416,7 +686,7 @@ class SmartPaintLabelV2(QWidget):
     🎯 核心特性：
     - 100% QLabel API兼容
     - 自动CSS样式解析和应用
-    - 数学保证的零截断
+    - 换行文本自动缩放字号完整显示，单行文本宽度不足时末尾省略（…）
     - 完美的背景和边框渲染
     - 无缝替换现有QLabel
     """
@@ -430,18 +700,31 @@ class SmartPaintLabelV2(QWidget):
         self._alignment = Qt.AlignLeft | Qt.AlignVCenter
         self._word_wrap = False
         self._stylesheet = ""
+        self._styled_font_key = None  # 上次应用样式表后的字体key，用于判断能否跳过重复样式表
         self._parsed_styles = {}
+        self._padding_tuple = _DEFAULT_PADDING  # (top, right, bottom, left)
+        self._content_rect = QRect()
+        
+        # 绘制对象缓存（样式或尺寸变化时重建，paintEvent中直接复用）
+        self._bg_brush = None
+        self._border_pen = None
+        self._text_pen = QPen(QColor('#000000'))
+        self._border_radius = None
+        self._last_calc_key = None  # 上次计算显示参数时的输入
+        # 显示参数是否需要重新计算：各setter只标记，paintEvent中统一计算一次
+        self._display_dirty = True
         
         # 内部状态
         self._size_hint = QSize(100, 30)  # 默认尺寸提示
+        self._cached_size_hint: Optional[QSize] = None  # 有文本时的尺寸提示缓存
         self._minimum_size_hint = QSize(0, 0)
         
         # 初始化
         self.setAttribute(Qt.WA_OpaquePaintEvent, False)  # 支持透明背景
         self.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Preferred)
         
-        # 重新计算显示参数
-        self._recalculate_display()
+        # 显示参数推迟到首次绘制时计算
+        self._update_content_rect()
     
     # ===== QLabel API 兼容方法 =====
     
@@ -449,7 +732,8 @@ class SmartPaintLabelV2(QWidget):
         """设置文本内容（QLabel兼容）"""
         if text != self._text:
             self._text = text
-            self._recalculate_display()
+            self._display_dirty = True
+            self._cached_size_hint = None
             self.update()
     
     def text(self) -> str:
@@ -458,16 +742,22 @@ class SmartPaintLabelV2(QWidget):
     
     def setFont(self, font: QFont):
         """设置字体（QLabel兼容）"""
-        self._font = font
-        self._recalculate_display()
+        if font.key() == self._font.key():
+            return
+        # 保存副本：调用方之后修改自己的字体对象不会绕过这里的缓存失效
+        self._font = QFont(font)
+        self._display_dirty = True
+        self._cached_size_hint = None
         self.update()
     
     def font(self) -> QFont:
-        """获取字体（QLabel兼容）"""
-        return self._font
+        """获取字体（QLabel兼容，与QLabel一样返回副本）"""
+        return QFont(self._font)
     
     def setAlignment(self, alignment: Qt.Alignment):
         """设置对齐方式（QLabel兼容）"""
+        if alignment == self._alignment:
+            return
         self._alignment = alignment
         self.update()
     
@@ -477,8 +767,10 @@ class SmartPaintLabelV2(QWidget):
     
     def setWordWrap(self, on: bool):
         """设置自动换行（QLabel兼容）"""
+        if on == self._word_wrap:
+            return
         self._word_wrap = on
-        self._recalculate_display()
+        self._display_dirty = True
         self.update()
     
     def wordWrap(self) -> bool:
@@ -487,10 +779,17 @@ class SmartPaintLabelV2(QWidget):
     
     def setStyleSheet(self, stylesheet: str):
         """设置样式表（QLabel兼容 + CSS解析）"""
+        # 重复应用相同主题、且字体在上次应用后未被替换时直接跳过
+        if stylesheet == self._stylesheet and self._font.key() == self._styled_font_key:
+            return
         self._stylesheet = stylesheet
-        self._parsed_styles = CSSStyleParser.parse_stylesheet(stylesheet)
+        # 复制缓存的只读结果，避免本地修改影响其他标签
+        self._parsed_styles = dict(parse_stylesheet(stylesheet))
         self._apply_parsed_styles()
-        self._recalculate_display()
+        self._styled_font_key = self._font.key()
+        self._update_content_rect()
+        self._display_dirty = True
+        self._cached_size_hint = None
         self.update()
     
     def styleSheet(self) -> str:
@@ -498,16 +797,18 @@ class SmartPaintLabelV2(QWidget):
         return self._stylesheet
     
     def sizeHint(self) -> QSize:
-        """建议尺寸（QLabel兼容）"""
-        if self._text:
-            metrics = QFontMetrics(self._font)
-            text_size = metrics.size(0, self._text)
+        """建议尺寸（QLabel兼容，布局时频繁调用，缓存到文本/字体/样式变化为止）"""
+        if not self._text:
+            return self._size_hint
+        
+        if self._cached_size_hint is None:
+            text_size = _metrics(self._font).size(0, self._text)
             padding = self._get_total_padding()
-            return QSize(
+            self._cached_size_hint = QSize(
                 text_size.width() + padding[1] + padding[3],   # left + right padding
                 text_size.height() + padding[0] + padding[2]   # top + bottom padding
             )
-        return self._size_hint
+        return self._cached_size_hint
     
     def minimumSizeHint(self) -> QSize:
         """最小尺寸（QLabel兼容）"""
@@ -517,7 +818,25 @@ class SmartPaintLabelV2(QWidget):
     
     def _apply_parsed_styles(self):
         """应用解析后的CSS样式"""
-        if not self._parsed_styles:
+        styles = self._parsed_styles
+        self._padding_tuple = styles.get('padding', _DEFAULT_PADDING)
+        
+        # 预先构建绘制用的画刷和画笔
+        self._bg_brush = QBrush(styles['background_color']) if 'background_color' in styles else None
+        self._border_radius = styles.get('border_radius')
+        self._text_pen = QPen(styles.get('color', QColor('#000000')))
+        
+        if 'border_width' in styles and 'border_color' in styles:
+            self._border_pen = QPen(styles['border_color'], styles['border_width'])
+            border_style = styles.get('border_style')
+            if border_style == 'dashed':
+                self._border_pen.setStyle(Qt.DashLine)
+            elif border_style == 'dotted':
+                self._border_pen.setStyle(Qt.DotLine)
+        else:
+            self._border_pen = None
+        
+        if not styles:
             return
         
         # 应用字体相关样式
@@ -529,16 +848,18 @@ class SmartPaintLabelV2(QWidget):
     
     def _get_total_padding(self) -> Tuple[int, int, int, int]:
         """获取总内边距 (top, right, bottom, left)"""
-        if 'padding' in self._parsed_styles:
-            return self._parsed_styles['padding']
-        return (6, 6, 6, 6)  # 默认内边距
+        return self._padding_tuple
     
     def _get_content_rect(self) -> QRect:
         """获取内容绘制区域（扣除内边距后）"""
+        return self._content_rect
+    
+    def _update_content_rect(self):
+        """重新计算内容区域（仅在尺寸或样式变化时调用）"""
         widget_rect = self.rect()
-        padding = self._get_total_padding()
+        padding = self._padding_tuple
         
-        return QRect(
+        self._content_rect = QRect(
             widget_rect.x() + padding[3],  # left padding
             widget_rect.y() + padding[0],  # top padding
             widget_rect.width() - padding[1] - padding[3],   # width - left - right
@@ -552,72 +873,75 @@ class SmartPaintLabelV2(QWidget):
         
         content_rect = self._get_content_rect()
         
+        # 文本、区域、字体和对齐都未变化时沿用上次结果（初始化时多个setter连续调用）
+        calc_key = (self._text, content_rect.getRect(), self._font.toString(),
+                    int(self._alignment), self._word_wrap)
+        if calc_key == self._last_calc_key:
+            return
+        
+        # 单行文本只是宽度超出时直接省略（一次elidedText调用），不再逐级缩小字号
+        if not self._word_wrap and '\n' not in self._text:
+            metrics = _metrics(self._font)
+            if (metrics.horizontalAdvance(self._text) > content_rect.width() and
+                    metrics.height() <= content_rect.height()):
+                self._display_params = {
+                    'draw_rect': content_rect,
+                    'font': self._font,
+                    'requires_scaling': False,
+                    'text_to_draw': metrics.elidedText(self._text, Qt.ElideRight, content_rect.width())
+                }
+                self._last_calc_key = calc_key
+                return
+        
         # 使用智能计算器计算最优显示
         self._display_params = SmartTextCalculator.calculate_optimal_display(
             text=self._text,
             available_rect=content_rect,
             font=self._font,
-            alignment=self._alignment
+            alignment=self._alignment,
+            word_wrap=self._word_wrap
         )
+        self._last_calc_key = calc_key
     
     def paintEvent(self, event):
         """高性能绘制实现"""
+        # 合并自上次绘制以来的所有属性变化，只计算一次
+        if self._display_dirty:
+            self._recalculate_display()
+            self._display_dirty = False
+        
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing, True)
+        # 直角背景/边框是轴对齐矩形，只有圆角时才需要抗锯齿
+        if self._border_radius is not None:
+            painter.setRenderHint(QPainter.Antialiasing, True)
         painter.setRenderHint(QPainter.TextAntialiasing, True)
         
         widget_rect = self.rect()
         
-        # 1. 绘制背景
-        self._draw_background(painter, widget_rect)
-        
-        # 2. 绘制边框
-        self._draw_border(painter, widget_rect)
+        # 1. 绘制背景和边框
+        self._draw_frame(painter, widget_rect)
         
-        # 3. 绘制文本
+        # 2. 绘制文本
         if self._text:
             self._draw_text(painter)
     
-    def _draw_background(self, painter: QPainter, rect: QRect):
-        """绘制背景"""
-        if 'background_color' in self._parsed_styles:
-            bg_color = self._parsed_styles['background_color']
-            
-            if 'border_radius' in self._parsed_styles:
-                # 圆角背景
-                radius = self._parsed_styles['border_radius']
-                path = QPainterPath()
-                path.addRoundedRect(rect, radius, radius)
-                painter.fillPath(path, QBrush(bg_color))
-            else:
-                # 直角背景
-                painter.fillRect(rect, bg_color)
-    
-    def _draw_border(self, painter: QPainter, rect: QRect):
-        """绘制边框"""
-        if ('border_width' in self._parsed_styles and 
-            'border_color' in self._parsed_styles):
-            
-            width = self._parsed_styles['border_width']
-            color = self._parsed_styles['border_color']
-            
-            pen = QPen(color, width)
-            if 'border_style' in self._parsed_styles:
-                style = self._parsed_styles['border_style']
-                if style == 'dashed':
-                    pen.setStyle(Qt.DashLine)
-                elif style == 'dotted':
-                    pen.setStyle(Qt.DotLine)
-            
-            painter.setPen(pen)
-            
-            if 'border_radius' in self._parsed_styles:
-                # 圆角边框
-                radius = self._parsed_styles['border_radius']
-                painter.drawRoundedRect(rect, radius, radius)
-            else:
-                # 直角边框
-                painter.drawRect(rect)
+    def _draw_frame(self, painter: QPainter, rect: QRect):
+        """
+        绘制背景和边框
+        画刷填充、画笔描边，一次绘制调用完成（只遍历一次几何形状）
+        """
+        if self._bg_brush is None and self._border_pen is None:
+            return
+        
+        painter.setBrush(self._bg_brush if self._bg_brush is not None else Qt.NoBrush)
+        painter.setPen(self._border_pen if self._border_pen is not None else Qt.NoPen)
+        
+        if self._border_radius is not None:
+            # 圆角（直接使用Qt的圆角矩形绘制，无需构造路径对象）
+            painter.drawRoundedRect(rect, self._border_radius, self._border_radius)
+        else:
+            # 直角
+            painter.drawRect(rect)
     
     def _draw_text(self, painter: QPainter):
         """绘制文本内容"""
@@ -628,13 +952,8 @@ class SmartPaintLabelV2(QWidget):
         font = self._display_params['font']
         painter.setFont(font)
         
-        # 文本颜色
-        if 'color' in self._parsed_styles:
-            text_color = self._parsed_styles['color']
-        else:
-            text_color = QColor('#000000')  # 默认黑色
-        
-        painter.setPen(QPen(text_color))
+        # 文本颜色（默认黑色）
+        painter.setPen(self._text_pen)
         
         # 绘制文本
         draw_rect = self._display_params['draw_rect']
@@ -643,12 +962,13 @@ class SmartPaintLabelV2(QWidget):
         if self._word_wrap:
             alignment_flags |= Qt.TextWordWrap
         
-        painter.drawText(draw_rect, alignment_flags, self._text)
+        painter.drawText(draw_rect, alignment_flags, self._display_params.get('text_to_draw', self._text))
     
     def resizeEvent(self, event):
         """处理尺寸变化"""
         super().resizeEvent(event)
-        self._recalculate_display()
+        self._update_content_rect()
+        self._display_dirty = True
 
 
 # ===== 便捷替换函数 =====
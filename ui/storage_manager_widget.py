@@ -7,45 +7,110 @@
 
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                              QTableWidget, QTableWidgetItem, QHeaderView,
-                             QPushButton, QCheckBox, QProgressBar, QFrame,
+                             QPushButton, QProgressBar, QFrame,
                              QSplitter, QGroupBox, QTextEdit, QApplication)
-from PyQt5.QtCore import Qt, pyqtSignal, QThread, pyqtSlot
+from PyQt5.QtCore import (Qt, pyqtSignal, pyqtSlot, QCoreApplication, QTimer,
+                          QObject, QRunnable, QThreadPool)
 from PyQt5.QtGui import QFont, QPalette, QColor, QIcon
 from typing import List, Dict, Any
+from pathlib import Path
 import logging
 
 from utils.storage_calculator import get_storage_calculator, ToolStorageInfo
 from utils.dependency_manager import get_dependency_manager
 
 
-class StorageAnalysisThread(QThread):
-    """存储分析线程，避免界面冻结"""
+def _load_qss() -> str:
+    """读取存储管理组件样式表（模块导入时执行一次）"""
+    qss_file = Path(__file__).parent.parent / "resources" / "storage_manager.qss"
+    try:
+        return qss_file.read_text(encoding='utf-8')
+    except OSError as e:
+        logging.warning(f"加载存储管理样式表失败 {qss_file}: {e}")
+        return ""
+
+
+# 存储管理组件样式表（按对象名限定作用范围，仅在 StorageManagerWidget 上设置一次）
+_QSS = _load_qss()
+
+
+class _StorageAnalysisSignals(QObject):
+    """存储分析任务的信号容器"""
     
-    analysis_finished = pyqtSignal(list, dict)  # tools_info, summary
+    load_started = pyqtSignal(int)              # 本次分析的工具总数（在第一批之前发出）
+    batch_ready = pyqtSignal(list)              # 一批 tools_info
+    analysis_done = pyqtSignal(dict)            # summary
     progress_updated = pyqtSignal(int, str)     # progress, status
+
+
+# 每批发送给界面线程的工具行数（界面线程在批次之间可以处理重绘和输入）
+_BATCH_SIZE = 50
+
+
+def _tr(text: str) -> str:
+    """存储分析任务的翻译（沿用原 StorageAnalysisThread 的翻译上下文）"""
+    return QCoreApplication.translate("StorageAnalysisThread", text)
+
+
+class StorageAnalysisTask(QRunnable):
+    """
+    存储分析任务，在全局线程池中执行，避免界面冻结
+    任务对象不自动删除，可重复提交，每次刷新无需重新创建线程和连接信号
+    """
+    
+    def __init__(self):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.signals = _StorageAnalysisSignals()
     
     def run(self):
         """在后台线程中执行存储分析"""
+        emit_progress = self.signals.progress_updated.emit
         try:
-            self.progress_updated.emit(10, self.tr("Scanning installed tools..."))
+            emit_progress(10, _tr("Scanning installed tools..."))
             calc = get_storage_calculator()
 
-            self.progress_updated.emit(40, self.tr("Calculating tool sizes..."))
+            emit_progress(40, _tr("Calculating tool sizes..."))
             tools_info = calc.get_all_tools_storage_info()
+            
+            # 显示文本在后台线程预先生成，界面线程填表时直接使用
+            none_text = QCoreApplication.translate("ToolsTableWidget", "None")
+            fmt = calc.format_size
+            for tool in tools_info:
+                tool.size_str = fmt(tool.size)
+                tool.deps_str = ", ".join(tool.dependencies) if tool.dependencies else none_text
+            
+            # 先通知总数，表格立即移除多余的旧行；再分批发送，
+            # 表格逐批追加行，后续的摘要统计与界面填表同时进行
+            self.signals.load_started.emit(len(tools_info))
+            emit_batch = self.signals.batch_ready.emit
+            for start in range(0, len(tools_info), _BATCH_SIZE):
+                emit_batch(tools_info[start:start + _BATCH_SIZE])
 
-            self.progress_updated.emit(70, self.tr("Analyzing storage usage..."))
+            emit_progress(70, _tr("Analyzing storage usage..."))
             summary = calc.get_storage_summary()
 
-            self.progress_updated.emit(100, self.tr("Analysis Complete"))
-            self.analysis_finished.emit(tools_info, summary)
+            emit_progress(100, _tr("Analysis Complete"))
+            self.signals.analysis_done.emit(summary)
             
         except Exception as e:
             logging.error(f"存储分析失败: {e}")
-            self.analysis_finished.emit([], {})
+            self.signals.analysis_done.emit({})
 
 
 
 
+class _SizeItem(QTableWidgetItem):
+    """大小列表格项：显示格式化文本，按 Qt.UserRole 中的原始字节数排序"""
+    
+    def __lt__(self, other):
+        size = self.data(Qt.UserRole)
+        other_size = other.data(Qt.UserRole)
+        if size is None or other_size is None:
+            return super().__lt__(other)
+        return size < other_size
+
+
 class ToolsTableWidget(QTableWidget):
     """工具列表表格组件"""
     
@@ -55,6 +120,11 @@ class ToolsTableWidget(QTableWidget):
         super().__init__(parent)
         self._init_table()
         self.tools_data = []
+        self._calc = get_storage_calculator()
+        self._selection_emit_pending = False  # 是否已安排选择变化通知
+        self._was_sorting = False  # 分批加载期间暂存的排序开关
+        self._load_row = 0  # 分批加载时下一行的写入位置
+        self.itemChanged.connect(self._on_item_changed)
     
     def _init_table(self):
         """初始化表格"""
@@ -66,23 +136,6 @@ class ToolsTableWidget(QTableWidget):
         # 设置表格样式
         self.setAlternatingRowColors(True)
         self.setSelectionBehavior(QTableWidget.SelectRows)
-        self.setStyleSheet("""
-            QTableWidget {
-                gridline-color: #e0e0e0;
-                background-color: white;
-                alternate-background-color: #f8f8f8;
-            }
-            QTableWidget::item {
-                padding: 8px;
-                border: none;
-            }
-            QHeaderView::section {
-                background-color: #f0f0f0;
-                border: 1px solid #e0e0e0;
-                padding: 8px;
-                font-weight: bold;
-            }
-        """)
         
         # 调整列宽
         header = self.horizontalHeader()
@@ -95,23 +148,74 @@ class ToolsTableWidget(QTableWidget):
         self.setColumnWidth(0, 30)
     
     def load_tools(self, tools_info: List[ToolStorageInfo]):
-        """加载工具数据"""
-        self.tools_data = tools_info
-        self.setRowCount(len(tools_info))
+        """一次性加载全部工具数据"""
+        self.begin_load(len(tools_info))
+        self.append_tools(tools_info)
+        self.finish_load()
+    
+    def begin_load(self, total_rows: int = None):
+        """
+        开始分批加载：暂停排序（加载结束后统一排序一次）
+        已知总行数时立即移除多余的旧行（如刚删除的工具），
+        保留的行全部取消勾选，后续批次从第0行起覆盖复用其中的表格项
+        """
+        self.tools_data = []
+        self._load_row = 0
+        self._was_sorting = self.isSortingEnabled()
+        self.setSortingEnabled(False)
+        self.blockSignals(True)
+        try:
+            if total_rows is not None and self.rowCount() > total_rows:
+                self.setRowCount(total_rows)
+            for row in range(self.rowCount()):
+                self.item(row, 0).setCheckState(Qt.Unchecked)
+        finally:
+            self.blockSignals(False)
+        # 加载期间不保留旧的勾选，立即通知一次（删除按钮随之禁用）
+        self._schedule_selection_changed()
+    
+    def append_tools(self, tools_info: List[ToolStorageInfo]):
+        """追加一批工具行（填充期间暂停重绘和信号，不触发itemChanged）"""
+        if not tools_info:
+            return
+        self.tools_data.extend(tools_info)
+        self.setUpdatesEnabled(False)
+        self.blockSignals(True)
+        first_row = self._load_row
+        self._load_row = first_row + len(tools_info)
+        # 已有的行直接复用表格项，只为超出部分新建行
+        reuse_end = self.rowCount()
+        if self._load_row > reuse_end:
+            self.setRowCount(self._load_row)
         
-        calc = get_storage_calculator()
+        fmt = self._calc.format_size
         
-        for row, tool in enumerate(tools_info):
-            # 复选框
-            checkbox = QCheckBox()
-            checkbox.stateChanged.connect(self._on_selection_changed)
-            self.setCellWidget(row, 0, checkbox)
+        for row, tool in enumerate(tools_info, first_row):
+            deps_text = tool.deps_str or (", ".join(tool.dependencies) if tool.dependencies else self.tr("None"))
+            
+            if row < reuse_end:
+                # 复用上次加载留下的表格项，只更新内容（勾选已在 begin_load 中重置）
+                self.item(row, 1).setText(tool.name)
+                size_item = self.item(row, 2)
+                size_item.setText(tool.size_str or fmt(tool.size))
+                size_item.setData(Qt.UserRole, tool.size)
+                self.item(row, 3).setText(tool.path)
+                deps_item = self.item(row, 4)
+                deps_item.setText(deps_text)
+                deps_item.setData(Qt.UserRole, tuple(tool.dependencies))
+                continue
+            
+            # 复选框（可勾选的表格项，状态保存在模型中，无需逐行创建QCheckBox控件）
+            check_item = QTableWidgetItem()
+            check_item.setFlags(Qt.ItemIsUserCheckable | Qt.ItemIsEnabled)
+            check_item.setCheckState(Qt.Unchecked)
+            self.setItem(row, 0, check_item)
             
             # 工具名称
             self.setItem(row, 1, QTableWidgetItem(tool.name))
             
             # 大小
-            size_item = QTableWidgetItem(calc.format_size(tool.size))
+            size_item = _SizeItem(tool.size_str or fmt(tool.size))
             size_item.setData(Qt.UserRole, tool.size)  # 存储原始字节数用于排序
             self.setItem(row, 2, size_item)
             
@@ -119,38 +223,57 @@ class ToolsTableWidget(QTableWidget):
             self.setItem(row, 3, QTableWidgetItem(tool.path))
             
             # 依赖环境
-            deps_text = ", ".join(tool.dependencies) if tool.dependencies else self.tr("None")
-            self.setItem(row, 4, QTableWidgetItem(deps_text))
+            deps_item = QTableWidgetItem(deps_text)
+            deps_item.setData(Qt.UserRole, tuple(tool.dependencies))  # 原始依赖列表，供后续筛选使用
+            self.setItem(row, 4, deps_item)
         
-        # 默认按大小排序（降序）
+        self.blockSignals(False)
+        self.setUpdatesEnabled(True)
+    
+    def finish_load(self):
+        """结束分批加载：移除多余的旧行，默认按大小排序（降序）并恢复排序开关"""
+        if self.rowCount() > self._load_row:
+            self.setRowCount(self._load_row)
         self.sortItems(2, Qt.DescendingOrder)
+        self.setSortingEnabled(self._was_sorting)
+        # 多余的行已移除，通知一次选择变化
+        self._schedule_selection_changed()
+    
+    def _on_item_changed(self, item: QTableWidgetItem):
+        """表格项变化：只处理复选框列，同一轮事件循环内的多次变化合并为一次通知"""
+        if item.column() == 0:
+            self._schedule_selection_changed()
+    
+    def _schedule_selection_changed(self):
+        """安排在下一轮事件循环发出选择变化通知（已安排时不重复）"""
+        if not self._selection_emit_pending:
+            self._selection_emit_pending = True
+            QTimer.singleShot(0, self._on_selection_changed)
     
     def _on_selection_changed(self):
         """处理选择变化"""
-        selected_tools = []
-        for row in range(self.rowCount()):
-            checkbox = self.cellWidget(row, 0)
-            if checkbox.isChecked():
-                tool_name = self.item(row, 1).text()
-                selected_tools.append(tool_name)
-        
-        self.tools_selection_changed.emit(selected_tools)
+        self._selection_emit_pending = False
+        self.tools_selection_changed.emit(self.get_selected_tools())
     
     def get_selected_tools(self) -> List[str]:
         """获取选中的工具名列表"""
-        selected_tools = []
-        for row in range(self.rowCount()):
-            checkbox = self.cellWidget(row, 0)
-            if checkbox.isChecked():
-                tool_name = self.item(row, 1).text()
-                selected_tools.append(tool_name)
-        return selected_tools
+        return [
+            self.item(row, 1).text()
+            for row in range(self.rowCount())
+            if self.item(row, 0).checkState() == Qt.Checked
+        ]
     
     def select_all_tools(self, select: bool = True):
         """全选/取消全选工具"""
-        for row in range(self.rowCount()):
-            checkbox = self.cellWidget(row, 0)
-            checkbox.setChecked(select)
+        state = Qt.Checked if select else Qt.Unchecked
+        # 逐项修改时不发信号，结束后只通知一次
+        self.blockSignals(True)
+        try:
+            for row in range(self.rowCount()):
+                self.item(row, 0).setCheckState(state)
+        finally:
+            self.blockSignals(False)
+        self._on_selection_changed()
 
 
 
@@ -163,34 +286,30 @@ class StorageManagerWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.logger = logging.getLogger(__name__)
+        self._calc = get_storage_calculator()
         self._init_ui()
         self._setup_connections()
         
-        # 分析线程
-        self.analysis_thread = None
+        # 分析任务（首次刷新时创建，之后重复提交到线程池）
+        self._analysis_task = None
+        self._running = False
+        self._load_started = False  # 本次分析是否已开始加载表格
         
         # 开始加载数据
         self.refresh_data()
     
     def _init_ui(self):
         """初始化界面"""
+        # 全部样式集中在 storage_manager.qss 中，只在本组件上设置一次
+        self.setObjectName("StorageManager")
+        self.setStyleSheet(_QSS)
+        
         layout = QVBoxLayout(self)
         layout.setSpacing(10)
         
         # 进度条（需要时显示）
         self.progress_bar = QProgressBar()
         self.progress_bar.setVisible(False)
-        self.progress_bar.setStyleSheet("""
-            QProgressBar {
-                border: 1px solid #bdc3c7;
-                border-radius: 5px;
-                text-align: center;
-            }
-            QProgressBar::chunk {
-                background-color: #3498db;
-                border-radius: 4px;
-            }
-        """)
         layout.addWidget(self.progress_bar)
         
         # 存储概览和操作按钮融合布局
@@ -200,7 +319,7 @@ class StorageManagerWidget(QWidget):
         # 存储概览信息（左侧）
         self.overview_info_label = QLabel(self.tr("Loading..."))
         self.overview_info_label.setFont(QFont("Microsoft YaHei", 11, QFont.Bold))
-        self.overview_info_label.setStyleSheet("color: #2c3e50;")
+        self.overview_info_label.setObjectName("overviewInfoLabel")
         header_layout.addWidget(self.overview_info_label)
 
         header_layout.addStretch()
@@ -211,50 +330,11 @@ class StorageManagerWidget(QWidget):
         self.refresh_btn = QPushButton(self.tr("Refresh"))
         self.delete_selected_btn = QPushButton(self.tr("Delete"))
         
-        # 按钮样式
-        button_style = """
-            QPushButton {
-                padding: 5px 10px;
-                border: 1px solid #bdc3c7;
-                border-radius: 3px;
-                background-color: white;
-            }
-            QPushButton:hover {
-                background-color: #ecf0f1;
-            }
-        """
-        self.select_all_btn.setStyleSheet(button_style)
-        self.select_none_btn.setStyleSheet(button_style)
-        self.refresh_btn.setStyleSheet("""
-            QPushButton {
-                padding: 5px 10px;
-                border: 1px solid #3498db;
-                border-radius: 3px;
-                background-color: #3498db;
-                color: white;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-        """)
-        self.delete_selected_btn.setStyleSheet("""
-            QPushButton {
-                padding: 5px 10px;
-                border: 1px solid #e74c3c;
-                border-radius: 3px;
-                background-color: #e74c3c;
-                color: white;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #c0392b;
-            }
-            QPushButton:disabled {
-                background-color: #bdc3c7;
-                border-color: #95a5a6;
-            }
-        """)
+        # 按钮样式由对象名匹配 storage_manager.qss 中的规则
+        self.select_all_btn.setObjectName("btnSelectAll")
+        self.select_none_btn.setObjectName("btnSelectNone")
+        self.refresh_btn.setObjectName("btnRefresh")
+        self.delete_selected_btn.setObjectName("btnDelete")
         self.delete_selected_btn.setEnabled(False)
         
         # 创建按钮容器，设置更紧凑的间距
@@ -287,17 +367,23 @@ class StorageManagerWidget(QWidget):
     
     def refresh_data(self):
         """刷新数据"""
-        if self.analysis_thread and self.analysis_thread.isRunning():
+        if self._running:
             return
+        self._running = True
+        self._load_started = False
         
         self.progress_bar.setVisible(True)
         self.progress_bar.setValue(0)
         self.refresh_btn.setEnabled(False)
         
-        self.analysis_thread = StorageAnalysisThread()
-        self.analysis_thread.analysis_finished.connect(self._on_analysis_finished)
-        self.analysis_thread.progress_updated.connect(self._on_progress_updated)
-        self.analysis_thread.start()
+        if self._analysis_task is None:
+            self._analysis_task = StorageAnalysisTask()
+            signals = self._analysis_task.signals
+            signals.load_started.connect(self._on_load_started)
+            signals.batch_ready.connect(self._on_batch_ready)
+            signals.analysis_done.connect(self._on_analysis_done)
+            signals.progress_updated.connect(self._on_progress_updated)
+        QThreadPool.globalInstance().start(self._analysis_task)
     
     @pyqtSlot(int, str)
     def _on_progress_updated(self, progress: int, status: str):
@@ -305,28 +391,41 @@ class StorageManagerWidget(QWidget):
         self.progress_bar.setValue(progress)
         self.progress_bar.setFormat(f"{status} ({progress}%)")
     
-    @pyqtSlot(list, dict)
-    def _on_analysis_finished(self, tools_info: List[ToolStorageInfo], summary: Dict):
+    @pyqtSlot(int)
+    def _on_load_started(self, total: int):
+        """工具列表已扫描完成：按总数开始加载，多余的旧行立即移除"""
+        self._load_started = True
+        self.tools_table.begin_load(total)
+    
+    @pyqtSlot(list)
+    def _on_batch_ready(self, tools_info: List[ToolStorageInfo]):
+        """收到一批工具数据：从第0行起覆盖旧行，逐批追加"""
+        self.tools_table.append_tools(tools_info)
+    
+    @pyqtSlot(dict)
+    def _on_analysis_done(self, summary: Dict):
         """分析完成处理"""
+        self._running = False
         self.progress_bar.setVisible(False)
         self.refresh_btn.setEnabled(True)
         
-        # 更新界面
-        self.tools_table.load_tools(tools_info)
+        # 更新界面（未开始加载表示分析失败，旧行在 finish_load 中全部移除）
+        if not self._load_started:
+            self.tools_table.begin_load(0)
+        self.tools_table.finish_load()
         self._update_overview_info(summary)
         
-        self.logger.info(f"存储分析完成，发现 {len(tools_info)} 个已安装工具")
+        self.logger.info(f"存储分析完成，发现 {len(self.tools_table.tools_data)} 个已安装工具")
     
     def _update_overview_info(self, summary: Dict):
         """更新概览信息显示"""
         try:
-            calc = get_storage_calculator()
+            fmt = self._calc.format_size
             
             # 格式化概览信息（精简版）
-            system_free = calc.format_size(summary['system_free'])
+            system_free = fmt(summary['system_free'])
             tools_count = summary['tools_count']
-            tools_size = calc.format_size(summary['tools_size'])
-            bionexus_total = calc.format_size(summary['bionexus_total'])
+            tools_size = fmt(summary['tools_size'])
             
             # 组合显示文本（精简版，删除总计部分）
             overview_text = self.tr("Remaining: {0} | Tools using: {1}/{2}").format(system_free, tools_count, tools_size)
@@ -8,11 +8,45 @@
 ✅ 替代方案: 使用 smart_text_module.py 中的智能文本组件
 📋 原因: QLabel/QText 存在文字截断、字体渲染、DPI适配等问题
 """
-from PyQt5.QtWidgets import QWidget, QLabel, QPushButton
-from PyQt5.QtCore import pyqtSignal, Qt
-from PyQt5.QtGui import QFont, QPainter, QPen, QColor
+from functools import lru_cache
+from PyQt5.QtWidgets import QWidget, QPushButton, QApplication
+from PyQt5.QtCore import pyqtSignal, Qt, QRect, QElapsedTimer, QTimer
+from PyQt5.QtGui import QFont, QPainter, QPen, QColor, QBrush, QPalette, QRegion, QPixmap
 from data.models import ToolStatus
 
+# 卡片描述最多显示的字符数
+_DESC_MAX_CHARS = 40
+
+# 安装进度文字的最短刷新间隔（毫秒，约30Hz）
+_PROGRESS_MIN_INTERVAL_MS = 33
+
+
+def _truncate_description(text: str) -> str:
+    """超出长度时截断并加省略号，短文本原样返回"""
+    if len(text) <= _DESC_MAX_CHARS:
+        return text
+    return text[:_DESC_MAX_CHARS] + "..."
+
+
+@lru_cache(maxsize=4096)
+def _card_description(tool_id: str, locale: str) -> str:
+    """
+    获取卡片上显示的本地化描述（已截断），按工具ID和语言缓存
+    locale 只用作缓存键：切换语言后会重新查询
+    """
+    from utils.tool_localization import get_localized_tool_description
+    return _truncate_description(get_localized_tool_description({'id': tool_id}))
+
+
+def _tool_card_description(tool_data: dict) -> str:
+    """卡片描述文本；本地化模块不可用时退回工具数据中的描述"""
+    try:
+        from utils.tool_localization import current_locale
+        tool_id = str(tool_data.get('id') or tool_data.get('name') or '').strip()
+        return _card_description(tool_id, current_locale() or 'zh_CN')
+    except Exception:
+        return _truncate_description(tool_data.get('description', ''))
+
 
 class ToolCard(QWidget):
     """
@@ -30,11 +64,70 @@ class ToolCard(QWidget):
     CARD_WIDTH = 81      # 黄金比例宽度
     CARD_HEIGHT = 50     # 固定高度
     
+    # 选中状态只影响边框，切换时只需重绘卡片四周的边框带（含抗锯齿余量）
+    _BORDER_STRIP = 4
+    _BORDER_REGION = (
+        QRegion(0, 0, CARD_WIDTH, _BORDER_STRIP)
+        .united(QRegion(0, CARD_HEIGHT - _BORDER_STRIP, CARD_WIDTH, _BORDER_STRIP))
+        .united(QRegion(0, 0, _BORDER_STRIP, CARD_HEIGHT))
+        .united(QRegion(CARD_WIDTH - _BORDER_STRIP, 0, _BORDER_STRIP, CARD_HEIGHT))
+    )
+    
+    # 文本区域（绝对定位，直接在 paintEvent 中绘制，不再使用子控件）
+    _NAME_RECT = QRect(4, 2, 73, 12)     # 工具名称
+    _STATUS_RECT = QRect(60, 2, 17, 12)  # 状态圆点 - 右上角
+    _DESC_RECT = QRect(4, 16, 73, 20)    # 描述文本 - 中间区域，允许换行
+    
+    # 当前选中的卡片（通过 ToolCard.select 切换，只需更新新旧两张卡片）
+    _current_selected = None
+    
+    # 所有卡片共用的绘制对象（不依赖QApplication，类定义时创建）
+    _PEN_SEL = QPen(QColor("#2563eb"), 2)
+    _PEN_UNSEL = QPen(QColor("#e2e8f0"), 1)
+    _BRUSH_WHITE = QBrush(QColor("white"))
+    _BACKGROUND_CACHE = {}  # (是否选中, 设备像素比) -> 预渲染的卡片背景和边框
+    
+    # 状态 -> (显示文本, 颜色)，在 paintEvent 中直接绘制
+    _STATUS_STYLE = {
+        ToolStatus.INSTALLED.value: ("●", QColor("#10b981")),  # 绿色
+        ToolStatus.AVAILABLE.value: ("●", QColor("#6b7280")),  # 灰色
+        ToolStatus.UPDATE.value: ("●", QColor("#f59e0b")),     # 橙色
+    }
+    
+    # 状态 -> 主按钮对象名（供样式表按对象名匹配）
+    _PRIMARY_OBJECT_NAMES = {
+        ToolStatus.INSTALLED.value: "LaunchBtn",
+        ToolStatus.AVAILABLE.value: "InstallBtn",
+        ToolStatus.UPDATE.value: "UpdateBtn",
+    }
+    
+    # 所有卡片共用的字体（需在QApplication创建后初始化，见 _ensure_fonts）
+    _NAME_FONT = None
+    _DESC_FONT = None
+    _BUTTON_FONT = None
+    
+    @classmethod
+    def _ensure_fonts(cls):
+        """首次创建卡片时初始化共享字体（字体族只从应用默认字体读取一次）"""
+        if cls._NAME_FONT is not None:
+            return
+        family = QApplication.font().family()
+        cls._NAME_FONT = QFont(family, 8, QFont.DemiBold)
+        # 描述和按钮字体相同，共用同一个实例
+        cls._DESC_FONT = cls._BUTTON_FONT = QFont(family, 7)
+    
     def __init__(self, tool_data: dict, parent=None):
         super().__init__(parent)
         self.tool_data = tool_data
         self.tool_name = tool_data['name']
         self.is_selected = False
+        self._update_search_text()
+        self._installing_text = None  # 安装中主按钮上当前显示的文字
+        self._progress_timer = QElapsedTimer()  # 距上次刷新进度文字的时间
+        self._pending_progress_text = None  # 限速期间暂存的最新进度文字
+        self._progress_flush_timer = QTimer(self)  # 限速结束后补显示最新进度
+        self._progress_flush_timer.setSingleShot(True)
+        self._progress_flush_timer.timeout.connect(self._flush_progress_text)
         
         # 强制设定固定尺寸，不允许任何拉伸
         self.setFixedSize(self.CARD_WIDTH, self.CARD_HEIGHT)
@@ -45,137 +138,160 @@ class ToolCard(QWidget):
     def init_ui(self):
         """初始化UI，使用绝对定位"""
         self.setObjectName("ToolCard")
-        self.setAttribute(Qt.WA_StyledBackground, True)
-        
-        # 工具名称 - 绝对定位
-        self.name_label = QLabel(self.tool_name, self)
-        self.name_label.setGeometry(4, 2, 73, 12)  # x, y, width, height
-        self.name_label.setObjectName("ToolName")
+        # 背景和边框完全由 paintEvent 绘制（样式表中 #ToolCard 的背景为透明），
+        # 不启用 WA_StyledBackground，省去每次绘制前的样式背景绘制
+        self._ensure_fonts()
         
-        # 使用小字体适应紧凑布局
-        name_font = QFont()
-        name_font.setPointSize(8)
-        name_font.setWeight(QFont.DemiBold)
-        self.name_label.setFont(name_font)
-        
-        # 状态标签 - 右上角
-        self.status_label = QLabel(self)
-        self.status_label.setGeometry(60, 2, 17, 12)
+        # 名称、状态和描述都在 paintEvent 中绘制，这里只准备好要显示的内容
+        self._status_text = ""
+        self._status_color = None
         self._update_status_display()
-        
-        # 描述文本 - 中间区域，允许换行
-        try:
-            from utils.tool_localization import get_localized_tool_description
-            base_desc = get_localized_tool_description(self.tool_data)
-        except Exception:
-            base_desc = self.tool_data.get('description', '')
-        description = (base_desc[:40] + "...") if base_desc else ""
-        self.description_label = QLabel(description, self)
-        self.description_label.setGeometry(4, 16, 73, 20)
-        self.description_label.setWordWrap(True)
-        self.description_label.setAlignment(Qt.AlignTop | Qt.AlignLeft)
-        
-        desc_font = QFont()
-        desc_font.setPointSize(7)
-        self.description_label.setFont(desc_font)
+        self._desc_text = _tool_card_description(self.tool_data)
         
         # 操作按钮 - 底部
         self._create_action_buttons()
     
     def _update_status_display(self):
-        """更新状态显示"""
-        status = self.tool_data['status']
+        """更新状态显示（只重绘状态圆点区域）"""
+        style = self._STATUS_STYLE.get(self.tool_data['status'])
+        if style is None:
+            return
         
-        if status == ToolStatus.INSTALLED.value:
-            self.status_label.setText("●")
-            self.status_label.setStyleSheet("color: #10b981;")  # 绿色
-        elif status == ToolStatus.AVAILABLE.value:
-            self.status_label.setText("●")
-            self.status_label.setStyleSheet("color: #6b7280;")  # 灰色
-        elif status == ToolStatus.UPDATE.value:
-            self.status_label.setText("●")
-            self.status_label.setStyleSheet("color: #f59e0b;")  # 橙色
+        self._status_text, self._status_color = style
+        self.update(self._STATUS_RECT)
     
     def _create_action_buttons(self):
-        """创建操作按钮，紧凑布局"""
-        status = self.tool_data['status']
+        """创建操作按钮，紧凑布局（主按钮和详情按钮常驻，状态变化时只修改内容）"""
+        # 主按钮：启动 / 安装 / 更新，随状态切换文字和对象名
+        self._primary_btn = QPushButton(self)
+        self._primary_btn.setGeometry(4, 38, 30, 10)  # 紧凑按钮
+        # 详情按钮
+        self.info_btn = QPushButton(self.tr("Details"), self)
+        self.info_btn.setGeometry(36, 38, 30, 10)
+        self.info_btn.setObjectName("InfoBtn")
         
-        if status == ToolStatus.INSTALLED.value:
-            # 已安装：启动按钮 + 详情按钮
-            self.launch_btn = QPushButton(self.tr("Launch"), self)
-            self.launch_btn.setGeometry(4, 38, 30, 10)  # 紧凑按钮
-            self.launch_btn.setObjectName("LaunchBtn")
-            # 详情按钮
-            self.info_btn = QPushButton(self.tr("Details"), self)
-            self.info_btn.setGeometry(36, 38, 30, 10)
-            self.info_btn.setObjectName("InfoBtn")
-        
-        elif status == ToolStatus.AVAILABLE.value:
-            # 未安装：安装按钮 + 详情按钮
-            self.install_btn = QPushButton(self.tr("Install"), self)
-            self.install_btn.setGeometry(4, 38, 30, 10)
-            self.install_btn.setObjectName("InstallBtn")
-            # 详情按钮
-            self.info_btn = QPushButton(self.tr("Details"), self)
-            self.info_btn.setGeometry(36, 38, 30, 10)
-            self.info_btn.setObjectName("InfoBtn")
-        
-        elif status == ToolStatus.UPDATE.value:
-            # 需要更新：更新按钮 + 详情按钮
-            self.update_btn = QPushButton(self.tr("Update"), self)
-            self.update_btn.setGeometry(4, 38, 30, 10)
-            self.update_btn.setObjectName("UpdateBtn")
-            # 详情按钮
-            self.info_btn = QPushButton(self.tr("Details"), self)
-            self.info_btn.setGeometry(36, 38, 30, 10)
-            self.info_btn.setObjectName("InfoBtn")
+        # 当前的操作按钮（点击判断时直接使用，无需遍历子对象树）
+        self._buttons = [self._primary_btn, self.info_btn]
         
         # 设置按钮字体
-        button_font = QFont()
-        button_font.setPointSize(7)
+        button_font = self._BUTTON_FONT
+        for button in self._buttons:
+            button.setFont(button_font)
+        
+        self._apply_state(self.tool_data['status'])
+    
+    def _primary_text(self, status: str) -> str:
+        """主按钮在各状态下的文字"""
+        if status == ToolStatus.INSTALLED.value:
+            return self.tr("Launch")
+        if status == ToolStatus.UPDATE.value:
+            return self.tr("Update")
+        return self.tr("Install")
+    
+    def _apply_state(self, status: str):
+        """按状态更新主按钮的文字和对象名；未知状态时隐藏操作按钮"""
+        object_name = self._PRIMARY_OBJECT_NAMES.get(status)
+        if object_name is None:
+            self._primary_btn.hide()
+            self.info_btn.hide()
+            return
         
-        for child in self.findChildren(QPushButton):
-            child.setFont(button_font)
+        button = self._primary_btn
+        button.setText(self._primary_text(status))
+        button.setEnabled(True)
+        if button.objectName() != object_name:
+            # 对象名变化后重新应用样式，使按对象名匹配的样式规则生效
+            button.setObjectName(object_name)
+            style = button.style()
+            style.unpolish(button)
+            style.polish(button)
+        button.show()
+        self.info_btn.show()
     
     def setup_connections(self):
-        """设置信号连接"""
-        if hasattr(self, 'install_btn'):
-            self.install_btn.clicked.connect(lambda: self.install_clicked.emit(self.tool_name))
+        """设置信号连接（按钮常驻，只连接一次；按钮和卡片同在GUI线程，直接连接）"""
+        self._primary_btn.clicked.connect(self._on_primary_clicked, Qt.DirectConnection)
+        self.info_btn.clicked.connect(self._on_info_clicked, Qt.DirectConnection)
+    
+    def _on_info_clicked(self):
+        """详情按钮点击"""
+        self.info_clicked.emit(self.tool_name)
+    
+    def _on_primary_clicked(self):
+        """主按钮点击：按当前状态发出启动或安装信号（更新也走安装流程）"""
+        status = self.tool_data['status']
+        if status == ToolStatus.INSTALLED.value:
+            self.launch_clicked.emit(self.tool_name)
+        elif status in (ToolStatus.AVAILABLE.value, ToolStatus.UPDATE.value):
+            self.install_clicked.emit(self.tool_name)
+    
+    @classmethod
+    def _background_pixmap(cls, selected: bool, dpr: float) -> QPixmap:
+        """
+        获取卡片背景和边框位图（按选中状态和设备像素比缓存，所有卡片共享）
+        抗锯齿圆角矩形只在首次使用时光栅化，之后每次绘制只需一次位图拷贝
+        """
+        key = (selected, dpr)
+        pixmap = cls._BACKGROUND_CACHE.get(key)
+        if pixmap is not None:
+            return pixmap
         
-        if hasattr(self, 'launch_btn'):
-            self.launch_btn.clicked.connect(lambda: self.launch_clicked.emit(self.tool_name))
+        pixmap = QPixmap(int(cls.CARD_WIDTH * dpr), int(cls.CARD_HEIGHT * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.transparent)  # 圆角外保持透明，让容器背景显示
         
-        if hasattr(self, 'update_btn'):
-            self.update_btn.clicked.connect(lambda: self.install_clicked.emit(self.tool_name))
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setBrush(cls._BRUSH_WHITE)  # 只有卡片区域是白色
+        if selected:
+            painter.setPen(cls._PEN_SEL)
+            painter.drawRoundedRect(1, 1, cls.CARD_WIDTH-2, cls.CARD_HEIGHT-2, 4, 4)
+        else:
+            painter.setPen(cls._PEN_UNSEL)
+            painter.drawRoundedRect(0, 0, cls.CARD_WIDTH-1, cls.CARD_HEIGHT-1, 3, 3)
+        painter.end()
         
-        if hasattr(self, 'info_btn'):
-            self.info_btn.clicked.connect(lambda: self.info_clicked.emit(self.tool_name))
+        cls._BACKGROUND_CACHE[key] = pixmap
+        return pixmap
     
     def paintEvent(self, event):
         """自定义绘制 - 只绘制卡片本身，不清除容器背景"""
+        # 只在需要重绘的区域内绘制（例如仅按钮或状态点变化时）
+        region = event.region()
+        if not region.intersects(self.rect()):
+            return
+        
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
+        painter.setClipRegion(region)
         
         # 移除fillRect清除背景的代码，让容器背景显示
         
-        # 只绘制卡片区域的背景和边框
-        if self.is_selected:
-            pen = QPen(QColor("#2563eb"), 2)
-            painter.setPen(pen)
-            painter.setBrush(QColor("white"))  # 只有卡片区域是白色
-            painter.drawRoundedRect(1, 1, self.CARD_WIDTH-2, self.CARD_HEIGHT-2, 4, 4)
-        else:
-            pen = QPen(QColor("#e2e8f0"), 1)
-            painter.setPen(pen)
-            painter.setBrush(QColor("white"))  # 只有卡片区域是白色
-            painter.drawRoundedRect(0, 0, self.CARD_WIDTH-1, self.CARD_HEIGHT-1, 3, 3)
+        # 只绘制卡片区域的背景和边框（预渲染位图）
+        painter.drawPixmap(0, 0, self._background_pixmap(self.is_selected, self.devicePixelRatioF()))
+        
+        # 文本（超出区域的部分被裁剪）
+        text_color = self.palette().color(QPalette.WindowText)
+        painter.setPen(text_color)
+        painter.setFont(self._NAME_FONT)
+        painter.drawText(self._NAME_RECT, Qt.AlignLeft | Qt.AlignVCenter, self.tool_name)
+        
+        if self._status_text:
+            painter.setPen(self._status_color)
+            painter.drawText(self._STATUS_RECT, Qt.AlignLeft | Qt.AlignVCenter, self._status_text)
+        
+        if self._desc_text:
+            painter.setPen(text_color)
+            painter.setFont(self._DESC_FONT)
+            painter.drawText(self._DESC_RECT, Qt.AlignTop | Qt.AlignLeft | Qt.TextWordWrap, self._desc_text)
     
     def mousePressEvent(self, event):
         """鼠标点击事件处理"""
         if event.button() == Qt.LeftButton:
             # 检查是否点击在按钮上
-            for child in self.findChildren(QPushButton):
-                if child.geometry().contains(event.pos()):
+            pos = event.pos()
+            for button in self._buttons:
+                if button.isVisible() and button.geometry().contains(pos):
                     super().mousePressEvent(event)
                     return
             
@@ -184,10 +300,27 @@ class ToolCard(QWidget):
         
         super().mousePressEvent(event)
     
+    @classmethod
+    def select(cls, card: 'ToolCard'):
+        """选中指定卡片（None 表示取消选中），只更新之前选中的卡片和新卡片"""
+        previous = cls._current_selected
+        if previous is card:
+            return
+        cls._current_selected = card
+        if previous is not None:
+            try:
+                previous.set_selected(False)
+            except RuntimeError:
+                pass  # 之前选中的卡片已被销毁
+        if card is not None:
+            card.set_selected(True)
+    
     def set_selected(self, selected: bool):
         """设置选中状态"""
+        if selected == self.is_selected:
+            return
         self.is_selected = selected
-        self.update()  # 触发重绘
+        self.update(self._BORDER_REGION)  # 只重绘边框带
     
     def update_tool_status(self, new_status: str, **kwargs):
         """更新工具状态"""
@@ -196,39 +329,63 @@ class ToolCard(QWidget):
         for key, value in kwargs.items():
             if key in self.tool_data:
                 self.tool_data[key] = value
+        if 'description' in kwargs:
+            self._update_search_text()
         
         # 更新显示
         self._update_status_display()
         
-        # 重新创建按钮
-        self._recreate_action_buttons()
-    
-    def _recreate_action_buttons(self):
-        """重新创建操作按钮"""
-        # 删除现有按钮
-        for child in self.findChildren(QPushButton):
-            child.deleteLater()
-        
-        # 重新创建按钮
-        self._create_action_buttons()
-        self.setup_connections()
+        # 复用现有按钮，只切换文字和对象名
+        self._apply_state(new_status)
     
     def set_installing_state(self, is_installing: bool, progress: int = -1, status_text: str = ""):
         """设置安装状态"""
+        # 只有未安装状态下主按钮是安装按钮
+        if self.tool_data['status'] != ToolStatus.AVAILABLE.value:
+            return
+        install_btn = self._primary_btn
         if is_installing:
-            if hasattr(self, 'install_btn'):
-                if progress >= 0:
-                    self.install_btn.setText(f"{progress}%")
-                elif status_text:
-                    self.install_btn.setText(status_text[:4])  # 限制字符数
-                else:
-                    self.install_btn.setText("...")
-                self.install_btn.setEnabled(False)
+            if progress >= 0:
+                text = f"{progress}%"
+                # 进度刷新限速：距上次刷新不足最短间隔时暂存，间隔结束后补显示（0%和100%总是立即显示）
+                if (progress not in (0, 100) and self._progress_timer.isValid()
+                        and self._progress_timer.elapsed() < _PROGRESS_MIN_INTERVAL_MS):
+                    self._pending_progress_text = text
+                    if not self._progress_flush_timer.isActive():
+                        self._progress_flush_timer.start(
+                            _PROGRESS_MIN_INTERVAL_MS - self._progress_timer.elapsed()
+                        )
+                    return
+            elif status_text:
+                text = status_text[:4]  # 限制字符数
+            else:
+                text = "..."
+            self._pending_progress_text = None
+            self._progress_flush_timer.stop()
+            self._show_installing_text(text)
+            install_btn.setEnabled(False)
         else:
             # 恢复正常状态
-            if hasattr(self, 'install_btn'):
-                self.install_btn.setText(self.tr("Install"))
-                self.install_btn.setEnabled(True)
+            self._pending_progress_text = None
+            self._progress_flush_timer.stop()
+            self._installing_text = None
+            self._progress_timer.invalidate()
+            install_btn.setText(self.tr("Install"))
+            install_btn.setEnabled(True)
+    
+    def _show_installing_text(self, text: str):
+        """显示安装中文字（未变化时不重复设置，避免按钮重新布局和重绘）"""
+        if text != self._installing_text:
+            self._installing_text = text
+            self._primary_btn.setText(text)
+            self._progress_timer.start()
+    
+    def _flush_progress_text(self):
+        """限速间隔结束：显示期间暂存的最新进度"""
+        if (self._pending_progress_text is not None
+                and self.tool_data['status'] == ToolStatus.AVAILABLE.value):
+            text, self._pending_progress_text = self._pending_progress_text, None
+            self._show_installing_text(text)
     
     def get_tool_name(self) -> str:
         """获取工具名称"""
@@ -238,14 +395,21 @@ class ToolCard(QWidget):
         """获取工具数据"""
         return self.tool_data.copy()
     
+    def _update_search_text(self):
+        """缓存小写的名称和描述，筛选时无需每次转换"""
+        self._name_lower = self.tool_name.lower()
+        self._desc_lower = self.tool_data.get('description', '').lower()
+    
     def matches_filter(self, search_term: str = "", categories: list = None, statuses: list = None) -> bool:
         """检查是否匹配筛选条件"""
+        return self._matches_lowered((search_term or "").lower(), categories, statuses)
+    
+    def _matches_lowered(self, search_term: str, categories: list = None, statuses: list = None) -> bool:
+        """检查是否匹配筛选条件（search_term 已转为小写）"""
         # 搜索匹配检查
-        if search_term:
-            search_term = search_term.lower()
-            if (search_term not in self.tool_name.lower() and 
-                search_term not in self.tool_data['description'].lower()):
-                return False
+        if (search_term and search_term not in self._name_lower
+                and search_term not in self._desc_lower):
+            return False
         
         # 分类筛选检查
         if categories and self.tool_data['category'] not in categories:
@@ -256,3 +420,12 @@ class ToolCard(QWidget):
             return False
         
         return True
+
+
+def filter_cards(cards, search_term: str = "", categories: list = None, statuses: list = None) -> list:
+    """
+    筛选匹配条件的卡片
+    搜索词只转换一次小写，适合搜索框每次输入时筛选整个卡片网格
+    """
+    search_term = (search_term or "").lower()
+    return [card for card in cards if card._matches_lowered(search_term, categories, statuses)]
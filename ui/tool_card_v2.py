@@ -5,10 +5,50 @@
 """
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-    QPushButton, QFrame, QGraphicsDropShadowEffect
+    QPushButton, QFrame, QStyle, QStyleOption, QApplication
 )
-from PyQt5.QtCore import Qt, pyqtSignal, QPropertyAnimation, QRect
-from PyQt5.QtGui import QFont, QFontMetrics, QPalette, QColor
+from PyQt5.QtCore import Qt, pyqtSignal, QPropertyAnimation, QRect, QRectF, QElapsedTimer, QTimer
+from PyQt5.QtGui import (
+    QFont, QFontMetrics, QPalette, QColor, QPainter, QPixmap, QTextLayout, QTextOption
+)
+
+# 安装进度文字的最短刷新间隔（毫秒，约30Hz）
+_PROGRESS_MIN_INTERVAL_MS = 33
+
+# 所有 ToolCardV2 共用的样式表，首次创建卡片时追加到应用样式表（只解析一次）
+# 规则均以 ToolCardV2 限定，不影响应用中的其他控件；选中状态通过动态属性 selected 匹配
+_STYLESHEET = """
+ToolCardV2 {
+    background-color: white;
+    border: 1px solid #e2e8f0;
+    border-radius: 8px;
+}
+ToolCardV2:hover {
+    border: 1px solid #cbd5e1;
+    background-color: #f8fafc;
+}
+ToolCardV2[selected="true"] {
+    border: 2px solid #3b82f6;
+    background-color: #eff6ff;
+}
+ToolCardV2 QPushButton {
+    background-color: #3b82f6;
+    color: white;
+    border: none;
+    border-radius: 4px;
+    font-size: 9px;
+    font-weight: 500;
+}
+ToolCardV2 QPushButton:hover {
+    background-color: #2563eb;
+}
+ToolCardV2 QPushButton#install {
+    background-color: #10b981;
+}
+ToolCardV2 QPushButton#install:hover {
+    background-color: #059669;
+}
+"""
 
 class ToolCardV2(QWidget):
     """
@@ -18,10 +58,38 @@ class ToolCardV2(QWidget):
     install_clicked = pyqtSignal(str)
     launch_clicked = pyqtSignal(str)
     
+    # 所有卡片共用的字体（需在QApplication创建后初始化，见 _ensure_fonts）
+    _TITLE_FONT = None
+    _DESC_FONT = None
+    
+    # 阴影参数：阴影画在卡片控件内部，卡片主体四周留出阴影边距
+    _SHADOW_MARGIN = 4       # 阴影渐变宽度
+    _SHADOW_OFFSET_Y = 2     # 阴影向下偏移
+    _SHADOW_MAX_ALPHA = 30   # 阴影最深处的不透明度
+    _BORDER_RADIUS = 8
+    _SHADOW_CACHE = {}       # (宽, 高, 设备像素比) -> 预渲染的阴影位图
+    
+    _STYLE_INSTALLED = False  # 共用样式表是否已追加到应用样式表
+    
+    @classmethod
+    def _ensure_fonts(cls):
+        """首次创建卡片时初始化共享字体（字体族只从应用默认字体读取一次）"""
+        if cls._TITLE_FONT is not None:
+            return
+        family = QApplication.font().family()
+        cls._TITLE_FONT = QFont(family, 11, QFont.Bold)
+        cls._DESC_FONT = QFont(family, 9)
+    
     def __init__(self, tool_data: dict, parent=None):
         super().__init__(parent)
         self.tool_data = tool_data
         self.is_selected = False  # 选中状态
+        self._installing_text = None  # 安装中安装按钮上当前显示的文字
+        self._progress_timer = QElapsedTimer()  # 距上次刷新进度文字的时间
+        self._pending_progress_text = None  # 限速期间暂存的最新进度文字
+        self._progress_flush_timer = QTimer(self)  # 限速结束后补显示最新进度
+        self._progress_flush_timer.setSingleShot(True)
+        self._progress_flush_timer.timeout.connect(self._flush_progress_text)
         self.setFixedSize(170, 113)  # 70×113px基础上适当放大
         self.setCursor(Qt.PointingHandCursor)
         self.init_ui()
@@ -29,6 +97,8 @@ class ToolCardV2(QWidget):
         
     def init_ui(self):
         """初始化UI布局"""
+        self._ensure_fonts()
+        
         # 主布局
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(10, 8, 10, 8)
@@ -36,17 +106,12 @@ class ToolCardV2(QWidget):
         
         # 1. 标题区域（加粗，12px）
         self.title_label = QLabel(self.tool_data['name'])
-        title_font = QFont()
-        title_font.setPointSize(11)
-        title_font.setBold(True)
-        self.title_label.setFont(title_font)
+        self.title_label.setFont(self._TITLE_FONT)
         self.title_label.setFixedHeight(20)
         
         # 2. 描述区域（35px高度，使用省略号）
         self.desc_label = QLabel()
-        desc_font = QFont()
-        desc_font.setPointSize(9)
-        self.desc_label.setFont(desc_font)
+        self.desc_label.setFont(self._DESC_FONT)
         self.desc_label.setWordWrap(True)
         self.desc_label.setFixedHeight(45)
         self.desc_label.setAlignment(Qt.AlignTop)
@@ -69,7 +134,7 @@ class ToolCardV2(QWidget):
             
             self.launch_btn = QPushButton(self.tr("Launch"))
             self.launch_btn.setFixedSize(45, 22)
-            self.launch_btn.clicked.connect(lambda: self.launch_clicked.emit(self.tool_data['name']))
+            self.launch_btn.clicked.connect(self._on_launch_clicked)
             
             self.memory_label = QLabel(f"📊{self.tool_data.get('disk_usage', 'N/A')}")
             self.memory_label.setStyleSheet("color: #64748b; font-size: 9px;")
@@ -86,7 +151,7 @@ class ToolCardV2(QWidget):
             
             self.install_btn = QPushButton(self.tr("Install"))
             self.install_btn.setFixedSize(45, 22)
-            self.install_btn.clicked.connect(lambda: self.install_clicked.emit(self.tool_data['name']))
+            self.install_btn.clicked.connect(self._on_install_clicked)
             
             self.detail_btn = QPushButton(self.tr("Details"))
             self.detail_btn.setFixedSize(40, 22)
@@ -110,100 +175,155 @@ class ToolCardV2(QWidget):
             description = get_localized_tool_description(self.tool_data)
         except Exception:
             description = self.tool_data.get('description', '')
+        # 合并连续空白（与原先按单词拼接的结果一致）
+        description = ' '.join(description.split())
         
-        # 使用QFontMetrics计算文本
-        metrics = QFontMetrics(self.desc_label.font())
+        font = self.desc_label.font()
         available_width = self.width() - 20  # 减去边距
         
-        # 计算两行能显示的文本
-        words = description.split()
-        lines = []
-        current_line = ""
+        # 第一行由 QTextLayout 按单词断行（C++ 实现，无需逐词测量）
+        option = QTextOption()
+        option.setWrapMode(QTextOption.WrapAtWordBoundaryOrAnywhere)
+        layout = QTextLayout(description, font)
+        layout.setTextOption(option)
+        layout.beginLayout()
+        line = layout.createLine()
+        if line.isValid():
+            line.setLineWidth(available_width)
+            split = line.textStart() + line.textLength()
+        else:
+            split = len(description)
+        layout.endLayout()
         
-        for word in words:
-            test_line = current_line + " " + word if current_line else word
-            if metrics.horizontalAdvance(test_line) <= available_width:
-                current_line = test_line
-            else:
-                if current_line:
-                    lines.append(current_line)
-                current_line = word
-                if len(lines) >= 2:
-                    break
+        # 第二行放剩余文本，超出宽度时以省略号结尾
+        first_line = description[:split].rstrip()
+        rest = description[split:].strip()
+        if rest:
+            second_line = QFontMetrics(font).elidedText(rest, Qt.ElideRight, available_width)
+            self.desc_label.setText(first_line + '\n' + second_line)
+        else:
+            self.desc_label.setText(first_line)
         
-        if current_line and len(lines) < 2:
-            lines.append(current_line)
+    def setup_styles(self):
+        """设置样式（共用样式表只在首张卡片创建时安装一次）"""
+        self.setProperty("selected", False)
+        self._install_stylesheet()
         
-        # 如果超过两行，第二行加省略号
-        if len(lines) >= 2 and len(words) > len(' '.join(lines[:2]).split()):
-            # 确保第二行能容纳省略号
-            second_line = lines[1]
-            while metrics.horizontalAdvance(second_line + "...") > available_width and len(second_line) > 0:
-                second_line = second_line[:-1]
-            lines[1] = second_line + "..."
+        # 阴影改为在 paintEvent 中绘制预渲染位图（不再使用逐帧模糊的 QGraphicsDropShadowEffect）
+    
+    @classmethod
+    def _install_stylesheet(cls):
+        """将卡片样式追加到应用样式表"""
+        if cls._STYLE_INSTALLED:
+            return
+        app = QApplication.instance()
+        if app is None:
+            return
+        app.setStyleSheet(app.styleSheet() + _STYLESHEET)
+        cls._STYLE_INSTALLED = True
+    
+    @classmethod
+    def _shadow_pixmap(cls, width: int, height: int, dpr: float) -> QPixmap:
+        """
+        获取卡片阴影位图（按尺寸和设备像素比缓存，所有实例共享）
+        用逐层叠加的半透明圆角矩形近似模糊阴影，只在首次使用时渲染一次
+        """
+        key = (width, height, dpr)
+        pixmap = cls._SHADOW_CACHE.get(key)
+        if pixmap is not None:
+            return pixmap
         
-        self.desc_label.setText('\n'.join(lines[:2]))
+        pixmap = QPixmap(int(width * dpr), int(height * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.transparent)
         
-    def setup_styles(self):
-        """设置样式"""
-        self.setStyleSheet("""
-            ToolCardV2 {
-                background-color: white;
-                border: 1px solid #e2e8f0;
-                border-radius: 8px;
-            }
-            ToolCardV2:hover {
-                border: 1px solid #cbd5e1;
-                background-color: #f8fafc;
-            }
-            QPushButton {
-                background-color: #3b82f6;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                font-size: 9px;
-                font-weight: 500;
-            }
-            QPushButton:hover {
-                background-color: #2563eb;
-            }
-            QPushButton#install {
-                background-color: #10b981;
-            }
-            QPushButton#install:hover {
-                background-color: #059669;
-            }
-        """)
-        
-        # 添加阴影效果
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(8)
-        shadow.setColor(QColor(0, 0, 0, 30))
-        shadow.setOffset(0, 2)
-        self.setGraphicsEffect(shadow)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        margin = cls._SHADOW_MARGIN
+        offset = cls._SHADOW_OFFSET_Y
+        # 外层到内层逐层叠加，越靠近卡片主体越深
+        painter.setBrush(QColor(0, 0, 0, cls._SHADOW_MAX_ALPHA // margin))
+        for i in range(margin):
+            radius = cls._BORDER_RADIUS + margin - i
+            painter.drawRoundedRect(
+                QRectF(i, offset + i, width - 2 * i, height - offset - 2 * i),
+                radius, radius
+            )
+        painter.end()
+        
+        cls._SHADOW_CACHE[key] = pixmap
+        return pixmap
+    
+    def paintEvent(self, event):
+        """绘制预渲染阴影，再在阴影边距内绘制样式表定义的卡片背景和边框"""
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._shadow_pixmap(self.width(), self.height(), self.devicePixelRatioF()))
+        
+        margin = self._SHADOW_MARGIN
+        option = QStyleOption()
+        option.initFrom(self)
+        option.rect = self.rect().adjusted(margin, self._SHADOW_OFFSET_Y, -margin, -margin - self._SHADOW_OFFSET_Y)
+        self.style().drawPrimitive(QStyle.PE_Widget, option, painter, self)
         
+    def _on_launch_clicked(self):
+        """启动按钮点击处理"""
+        self.launch_clicked.emit(self.tool_data['name'])
+    
+    def _on_install_clicked(self):
+        """安装按钮点击处理"""
+        self.install_clicked.emit(self.tool_data['name'])
+    
     def _on_detail_clicked(self):
         """详情按钮点击处理"""
         self.clicked.emit(self.tool_data)
     
     def set_installing_state(self, is_installing: bool, progress: int = -1, status_text: str = ""):
         """设置安装状态（兼容性方法）"""
+        if not hasattr(self, 'install_btn'):
+            return
         if is_installing:
-            if hasattr(self, 'install_btn'):
-                if progress >= 0:
-                    self.install_btn.setText(f"{progress}%")
-                elif status_text:
-                    # 限制文本长度以适应按钮
-                    display_text = status_text[:6] if len(status_text) > 6 else status_text
-                    self.install_btn.setText(display_text)
-                else:
-                    self.install_btn.setText("...")
-                self.install_btn.setEnabled(False)
+            if progress >= 0:
+                display_text = f"{progress}%"
+                # 进度刷新限速：距上次刷新不足最短间隔时暂存，间隔结束后补显示（0%和100%总是立即显示）
+                if (progress not in (0, 100) and self._progress_timer.isValid()
+                        and self._progress_timer.elapsed() < _PROGRESS_MIN_INTERVAL_MS):
+                    self._pending_progress_text = display_text
+                    if not self._progress_flush_timer.isActive():
+                        self._progress_flush_timer.start(
+                            _PROGRESS_MIN_INTERVAL_MS - self._progress_timer.elapsed()
+                        )
+                    return
+            elif status_text:
+                # 限制文本长度以适应按钮
+                display_text = status_text[:6]
+            else:
+                display_text = "..."
+            self._pending_progress_text = None
+            self._progress_flush_timer.stop()
+            self._show_installing_text(display_text)
+            self.install_btn.setEnabled(False)
         else:
             # 恢复正常状态
-            if hasattr(self, 'install_btn'):
-                self.install_btn.setText(self.tr("Install"))
-                self.install_btn.setEnabled(True)
+            self._pending_progress_text = None
+            self._progress_flush_timer.stop()
+            self._installing_text = None
+            self._progress_timer.invalidate()
+            self.install_btn.setText(self.tr("Install"))
+            self.install_btn.setEnabled(True)
+    
+    def _show_installing_text(self, text: str):
+        """显示安装中文字（未变化时不重复设置，避免按钮重新布局和重绘）"""
+        if text != self._installing_text:
+            self._installing_text = text
+            self.install_btn.setText(text)
+            self._progress_timer.start()
+    
+    def _flush_progress_text(self):
+        """限速间隔结束：显示期间暂存的最新进度"""
+        if self._pending_progress_text is not None and hasattr(self, 'install_btn'):
+            text, self._pending_progress_text = self._pending_progress_text, None
+            self._show_installing_text(text)
         
     def mousePressEvent(self, event):
         """鼠标点击事件"""
@@ -223,20 +343,12 @@ class ToolCardV2(QWidget):
     
     def set_selected(self, selected: bool):
         """设置选中状态"""
+        if selected == self.is_selected:
+            return
         self.is_selected = selected
-        if selected:
-            # 选中状态样式
-            self.setStyleSheet("""
-                QWidget {
-                    border: 2px solid #3b82f6;
-                    background-color: #eff6ff;
-                }
-            """)
-        else:
-            # 非选中状态样式
-            self.setStyleSheet("""
-                QWidget {
-                    border: 1px solid #e2e8f0;
-                    background-color: white;
-                }
-            """)
+        # 切换动态属性并重新应用样式，由共用样式表中的 [selected="true"] 规则生效
+        self.setProperty("selected", selected)
+        style = self.style()
+        style.unpolish(self)
+        style.polish(self)
+        self.update()
@@ -7,12 +7,15 @@
 """
 
 from PyQt5.QtWidgets import QWidget, QPushButton, QGraphicsDropShadowEffect
-from PyQt5.QtCore import Qt, pyqtSignal, QRect, QRectF, QPointF
+from PyQt5.QtCore import Qt, pyqtSignal, QRect, QRectF, QPointF, QElapsedTimer, QTimer
 from PyQt5.QtGui import (
     QPainter, QColor, QFont, QFontMetrics, QPen, QBrush, 
     QPainterPath, QLinearGradient
 )
 
+# 安装进度文字的最短刷新间隔（毫秒，约30Hz）
+_PROGRESS_MIN_INTERVAL_MS = 33
+
 
 class ToolCardV3(QWidget):
     """
@@ -42,7 +45,15 @@ class ToolCardV3(QWidget):
         self.is_selected = False
         self.is_hovered = False
         self.is_favorite = tool_data.get('is_favorite', False)
+        self._installing_text = None  # 安装中安装按钮上当前显示的文字
+        self._progress_timer = QElapsedTimer()  # 距上次刷新进度文字的时间
+        self._pending_progress_text = None  # 限速期间暂存的最新进度文字
+        self._progress_flush_timer = QTimer(self)  # 限速结束后补显示最新进度
+        self._progress_flush_timer.setSingleShot(True)
+        self._progress_flush_timer.timeout.connect(self._flush_progress_text)
         
+        # 子控件需要原生窗口时不连带把卡片和网格容器也变成原生窗口
+        self.setAttribute(Qt.WA_DontCreateNativeAncestors)
         # 设置固定大小
         self.setFixedSize(self.CARD_WIDTH, self.CARD_HEIGHT)
         self.setCursor(Qt.PointingHandCursor)
@@ -194,6 +205,15 @@ class ToolCardV3(QWidget):
         shadow.setOffset(0, 2)
         self.setGraphicsEffect(shadow)
     
+    def set_effect_enabled(self, enabled: bool):
+        """
+        启用/暂停阴影效果
+        滚动和缩放期间暂停，避免每次重绘都执行模糊计算
+        """
+        effect = self.graphicsEffect()
+        if effect is not None and effect.isEnabled() != enabled:
+            effect.setEnabled(enabled)
+    
     def paintEvent(self, event):
         """绘制卡片内容"""
         painter = QPainter(self)
@@ -496,6 +516,11 @@ class ToolCardV3(QWidget):
         total_width = self.CARD_WIDTH - 2 * self.PADDING
         button_width = (total_width - button_spacing) // 2
 
+        # 状态变化后丢弃尚未显示的安装进度
+        self._pending_progress_text = None
+        self._progress_flush_timer.stop()
+        self._installing_text = None
+
         # 切换按钮集合
         if status == 'installed':
             # 移除安装按钮（如存在）
@@ -547,19 +572,48 @@ class ToolCardV3(QWidget):
     
     def set_installing_state(self, is_installing: bool, progress: int = -1, status_text: str = ""):
         """设置安装状态 - 保持兼容性"""
-        if hasattr(self, 'install_btn'):
-            if is_installing:
-                if progress >= 0:
-                    self.install_btn.setText(self.tr("{0}%").format(progress))
-                elif status_text:
-                    display_text = status_text[:6] if len(status_text) > 6 else status_text
-                    self.install_btn.setText(display_text)
-                else:
-                    self.install_btn.setText("...")
-                self.install_btn.setEnabled(False)
+        if getattr(self, 'install_btn', None) is None:
+            return
+        if is_installing:
+            if progress >= 0:
+                display_text = self.tr("{0}%").format(progress)
+                # 进度刷新限速：距上次刷新不足最短间隔时暂存，间隔结束后补显示（0%和100%总是立即显示）
+                if (progress not in (0, 100) and self._progress_timer.isValid()
+                        and self._progress_timer.elapsed() < _PROGRESS_MIN_INTERVAL_MS):
+                    self._pending_progress_text = display_text
+                    if not self._progress_flush_timer.isActive():
+                        self._progress_flush_timer.start(
+                            _PROGRESS_MIN_INTERVAL_MS - self._progress_timer.elapsed()
+                        )
+                    return
+            elif status_text:
+                display_text = status_text[:6] if len(status_text) > 6 else status_text
             else:
-                self.install_btn.setText(self.tr("Install"))
-                self.install_btn.setEnabled(True)
+                display_text = "..."
+            self._pending_progress_text = None
+            self._progress_flush_timer.stop()
+            self._show_installing_text(display_text)
+            self.install_btn.setEnabled(False)
+        else:
+            self._pending_progress_text = None
+            self._progress_flush_timer.stop()
+            self._installing_text = None
+            self._progress_timer.invalidate()
+            self.install_btn.setText(self.tr("Install"))
+            self.install_btn.setEnabled(True)
+    
+    def _show_installing_text(self, text: str):
+        """显示安装中文字（未变化时不重复设置，避免按钮重新布局和重绘）"""
+        if text != self._installing_text:
+            self._installing_text = text
+            self.install_btn.setText(text)
+            self._progress_timer.start()
+    
+    def _flush_progress_text(self):
+        """限速间隔结束：显示期间暂存的最新进度"""
+        if self._pending_progress_text is not None and getattr(self, 'install_btn', None) is not None:
+            text, self._pending_progress_text = self._pending_progress_text, None
+            self._show_installing_text(text)
     
     def set_favorite(self, is_favorite: bool):
         """设置收藏状态"""
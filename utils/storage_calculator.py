@@ -23,6 +23,8 @@ class ToolStorageInfo:
     status: str                 # 安装状态
     dependencies: List[str]     # 依赖环境列表
     install_date: str = ""      # 安装日期（如果有记录）
+    size_str: str = ""          # 格式化后的大小（由后台分析线程预先计算）
+    deps_str: str = ""          # 依赖环境显示文本（由后台分析线程预先计算）
 
 
 class StorageCalculator: